@@ -6,8 +6,12 @@ career loop, and fight/training/save actions.
 
 from __future__ import annotations
 
+import os
 import random
+import sys
+from functools import lru_cache
 from pathlib import Path
+from typing import Callable
 
 from boxing_game.constants import ORGANIZATION_NAMES
 from boxing_game.models import CareerState
@@ -17,10 +21,11 @@ from boxing_game.modules.amateur_circuit import (
     generate_opponent,
     pro_readiness_status,
 )
+from boxing_game.modules.attribute_engine import training_focuses
 from boxing_game.modules.experience_engine import boxer_experience_profile, total_career_fights
 from boxing_game.modules.career_clock import advance_month
 from boxing_game.modules.fight_sim_engine import simulate_amateur_fight, simulate_pro_fight
-from boxing_game.modules.player_profile import create_boxer
+from boxing_game.modules.player_profile import VALID_STANCES, create_boxer
 from boxing_game.modules.pro_career import (
     apply_pro_fight_result,
     available_division_moves,
@@ -30,6 +35,8 @@ from boxing_game.modules.pro_career import (
     format_purse_breakdown,
     generate_pro_opponent,
     offer_purse,
+    organization_division_champion,
+    organization_division_defenses,
     player_lineal_division,
     player_pound_for_pound_position,
     pro_tier,
@@ -54,12 +61,34 @@ from boxing_game.modules.savegame import (
     save_state,
 )
 from boxing_game.modules.world_sim import simulate_world_month
-from boxing_game.rules_registry import load_rule_set
+
+
+_YES = frozenset(("y", "yes"))
+_NOT_A_NUMBER = "Please enter a whole number."
+_RANGE_ERROR = "Value must be between {} and {}.".format
+
+
+def _read_line(prompt: str) -> str:
+    """Read one line of input, bypassing ``input()`` for scripted stdin.
+
+    Interactive terminals keep ``input()`` for line editing; piped or
+    replayed input is read straight from the buffered stream.
+    """
+    stdin = sys.stdin
+    if stdin.isatty():
+        return input(prompt)
+    stdout = sys.stdout
+    stdout.write(prompt)
+    stdout.flush()
+    line = stdin.readline()
+    if not line:
+        raise EOFError
+    return line
 
 
 def _prompt_non_empty(prompt: str) -> str:
     while True:
-        value = input(prompt).strip()
+        value = _read_line(prompt).strip()
         if value:
             return value
         print("Input cannot be empty.")
@@ -67,66 +96,79 @@ def _prompt_non_empty(prompt: str) -> str:
 
 def _prompt_int(prompt: str, minimum: int, maximum: int) -> int:
     while True:
-        raw = input(prompt).strip()
+        raw = _read_line(prompt).strip()
         try:
             value = int(raw)
         except ValueError:
-            print("Please enter a whole number.")
+            print(_NOT_A_NUMBER)
             continue
 
         if minimum <= value <= maximum:
             return value
-        print(f"Value must be between {minimum} and {maximum}.")
+        print(_RANGE_ERROR(minimum, maximum))
 
 
 def _advance_month(
     state: CareerState,
     months: int = 1,
     *,
-    rng: random.Random | None = None,
+    rng: random.Random,
 ) -> bool:
-    randomizer = rng or random.Random()
     for _ in range(months):
         events = advance_month(state, months=1)
-        for event in events:
-            print(event)
-        for world_event in simulate_world_month(state, rng=randomizer):
+        if events:
+            print("\n".join(events))
+        for world_event in simulate_world_month(state, rng=rng):
             print(f"World: {world_event}")
-        retirement = evaluate_retirement(state, rng=randomizer)
+        retirement = evaluate_retirement(state, rng=rng)
         if retirement.newly_retired:
             print(f"Retirement: {retirement.reason}")
             return True
     return False
 
 
+# Bound templates for the repeated list rows in the profile view.
+_format_item = "  - {}".format
+_format_pair = "  - {}: {}".format
+_format_org_champion = "  - {}: {} (D{})".format
+
+
+def _rank_label(rank: int | None) -> str:
+    return f"#{rank}" if rank is not None else "Unranked"
+
+
 def _render_stats(state: CareerState) -> None:
     boxer = state.boxer
-    stage = "pro" if state.pro_career.is_active else "amateur"
+    profile = boxer.profile
+    aging = boxer.aging_profile
+    pc = state.pro_career
+    pro_record = pc.record
+    stage = "pro" if pc.is_active else "amateur"
     overall_rating = boxer_overall_rating(
         boxer,
         stage=stage,
-        pro_record=state.pro_career.record,
+        pro_record=pro_record,
     )
-    experience = boxer_experience_profile(boxer, pro_record=state.pro_career.record)
-    fights_total = total_career_fights(boxer, pro_record=state.pro_career.record)
-    print("\n== Boxer Profile ==")
-    print(f"Name: {boxer.profile.name} ({boxer.profile.stance})")
-    print(f"Age: {boxer.profile.age}")
-    print(
-        f"Height/Weight: {boxer.profile.height_ft}'{boxer.profile.height_in}\" / {boxer.profile.weight_lbs} lbs"
+    experience = boxer_experience_profile(boxer, pro_record=pro_record)
+    fights_total = total_career_fights(boxer, pro_record=pro_record)
+    out: list[str] = ["\n== Boxer Profile =="]
+    out.append(f"Name: {profile.name} ({profile.stance})")
+    out.append(f"Age: {profile.age}")
+    out.append(
+        f"Height/Weight: {profile.height_ft}'{profile.height_in}\" / {profile.weight_lbs} lbs"
     )
-    print(f"Division: {boxer.division}")
-    print(
+    out.append(f"Division: {boxer.division}")
+    out.append(
         (
             "Aging Profile: "
-            f"Peak ~{boxer.aging_profile.peak_age}, "
-            f"Decline Onset ~{boxer.aging_profile.decline_onset_age}, "
-            f"Decline Severity x{boxer.aging_profile.decline_severity:.2f}, "
-            f"IQ Growth x{boxer.aging_profile.iq_growth_factor:.2f}"
+            f"Peak ~{aging.peak_age}, "
+            f"Decline Onset ~{aging.decline_onset_age}, "
+            f"Decline Severity x{aging.decline_severity:.2f}, "
+            f"IQ Growth x{aging.iq_growth_factor:.2f}"
         )
     )
-    print(f"Overall Rating: {overall_rating}")
-    print(
+    out.append(f"Overall Rating: {overall_rating}")
+    out.append(
         (
             f"Experience: {experience.points} XP | "
             f"Level {experience.level} ({experience.title}) | "
@@ -134,82 +176,77 @@ def _render_stats(state: CareerState) -> None:
         )
     )
     if experience.next_level_points is None:
-        print("Experience Progress: max level reached.")
+        out.append("Experience Progress: max level reached.")
     else:
-        print(
+        out.append(
             f"Experience Progress: {experience.points}/{experience.next_level_points} to next level"
         )
-    print(f"Career Fights: {fights_total}")
+    out.append(f"Career Fights: {fights_total}")
 
-    if state.pro_career.is_active:
-        pro_record = state.pro_career.record
-        print(
+    amateur_record = boxer.record
+    if pc.is_active:
+        out.append(
             f"Pro Record: {pro_record.wins}-{pro_record.losses}-{pro_record.draws} (KO {pro_record.kos})"
         )
-        print(
+        out.append(
             "Amateur Record: "
-            f"{boxer.record.wins}-{boxer.record.losses}-{boxer.record.draws} (KO {boxer.record.kos})"
+            f"{amateur_record.wins}-{amateur_record.losses}-{amateur_record.draws} (KO {amateur_record.kos})"
         )
-        print(
-            f"Promoter: {state.pro_career.promoter} | Focus Org: {state.pro_career.organization_focus}"
+        out.append(
+            f"Promoter: {pc.promoter} | Focus Org: {pc.organization_focus}"
         )
-        print(
-            f"Balance: ${state.pro_career.purse_balance:,.2f} | "
-            f"Total Earnings: ${state.pro_career.total_earnings:,.2f}"
+        out.append(
+            f"Balance: ${pc.purse_balance:,.2f} | "
+            f"Total Earnings: ${pc.total_earnings:,.2f}"
+        )
+        out.append(f"Injury Risk: {boxer.injury_risk}/100")
+        out.append("Staff:")
+        out.extend(map(_format_item, staff_summary_lines(state)))
+        out.append("Rankings:")
+        rankings = pc.rankings
+        out.extend(
+            _format_pair(org_name, _rank_label(rankings.get(org_name)))
+            for org_name in ORGANIZATION_NAMES
         )
-        print(f"Injury Risk: {boxer.injury_risk}/100")
-        print("Staff:")
-        for line in staff_summary_lines(state):
-            print(f"  - {line}")
-        print("Rankings:")
-        for org_name, rank in state.pro_career.rankings.items():
-            label = f"#{rank}" if rank is not None else "Unranked"
-            print(f"  - {org_name}: {label}")
-        print("Organization Champions (current division):")
+        out.append("Organization Champions (current division):")
+        division = boxer.division
         for org_name in ORGANIZATION_NAMES:
-            champion = state.pro_career.organization_champions.get(org_name, {}).get(
-                state.boxer.division
-            )
-            defenses = state.pro_career.organization_defenses.get(org_name, {}).get(
-                state.boxer.division,
-                0,
-            )
-            champion_label = champion or "Vacant"
-            print(f"  - {org_name}: {champion_label} (D{defenses})")
+            champion = organization_division_champion(state, org_name, division)
+            defenses = organization_division_defenses(state, org_name, division)
+            out.append(_format_org_champion(org_name, champion or "Vacant", defenses))
         p4p_rank, p4p_score = player_pound_for_pound_position(state)
         p4p_label = f"#{p4p_rank}" if p4p_rank is not None else "Outside Top 120"
         lineal_holder = current_division_lineal_champion(state) or "Vacant"
         player_lineal = player_lineal_division(state)
         if player_lineal is not None:
-            defenses = state.pro_career.lineal_defenses.get(player_lineal, 0)
-            print(f"Lineal: Champion at {player_lineal} ({defenses} defenses)")
+            defenses = pc.lineal_defenses.get(player_lineal, 0)
+            out.append(f"Lineal: Champion at {player_lineal} ({defenses} defenses)")
         else:
-            print("Lineal: Not champion")
-        print(f"Current Division Lineal Champion: {lineal_holder}")
-        print(f"P4P: {p4p_label} ({p4p_score:.2f})")
-        if state.pro_career.last_world_news:
-            print("World News:")
-            for item in state.pro_career.last_world_news[-6:]:
-                print(f"  - {item}")
+            out.append("Lineal: Not champion")
+        out.append(f"Current Division Lineal Champion: {lineal_holder}")
+        out.append(f"P4P: {p4p_label} ({p4p_score:.2f})")
+        if pc.last_world_news:
+            out.append("World News:")
+            out.extend(map(_format_item, pc.last_world_news[-6:]))
         if state.is_retired:
-            print(f"Status: RETIRED at age {state.retirement_age}")
+            out.append(f"Status: RETIRED at age {state.retirement_age}")
             if state.retirement_reason:
-                print(f"Retirement Reason: {state.retirement_reason}")
+                out.append(f"Retirement Reason: {state.retirement_reason}")
     else:
-        print(
-            f"Amateur Record: {boxer.record.wins}-{boxer.record.losses}-{boxer.record.draws} (KO {boxer.record.kos})"
+        out.append(
+            f"Amateur Record: {amateur_record.wins}-{amateur_record.losses}-{amateur_record.draws} (KO {amateur_record.kos})"
         )
-        print(f"Amateur Points: {boxer.amateur_points}")
-        print(f"Injury Risk: {boxer.injury_risk}/100")
+        out.append(f"Amateur Points: {boxer.amateur_points}")
+        out.append(f"Injury Risk: {boxer.injury_risk}/100")
         if state.is_retired:
-            print(f"Status: RETIRED at age {state.retirement_age}")
+            out.append(f"Status: RETIRED at age {state.retirement_age}")
             if state.retirement_reason:
-                print(f"Retirement Reason: {state.retirement_reason}")
+                out.append(f"Retirement Reason: {state.retirement_reason}")
 
-    print(f"Popularity: {boxer.popularity} | Fatigue: {boxer.fatigue}")
-    print("Stats:")
-    for key, value in boxer.stats.to_dict().items():
-        print(f"  - {key}: {value}")
+    out.append(f"Popularity: {boxer.popularity} | Fatigue: {boxer.fatigue}")
+    out.append("Stats:")
+    out.extend(_format_pair(key, value) for key, value in boxer.stats.to_dict().items())
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def _new_career() -> CareerState:
@@ -217,8 +254,8 @@ def _new_career() -> CareerState:
     name = _prompt_non_empty("Name: ")
 
     while True:
-        stance = input("Stance (orthodox/southpaw): ").strip().lower()
-        if stance in {"orthodox", "southpaw"}:
+        stance = _read_line("Stance (orthodox/southpaw): ").strip().casefold()
+        if stance in VALID_STANCES:
             break
         print("Stance must be orthodox or southpaw.")
 
@@ -276,8 +313,8 @@ def _load_career() -> CareerState | None:
             return state
 
         if action == 2:
-            confirm = input(f"Delete '{selected}'? This cannot be undone. (y/n): ").strip().lower()
-            if confirm not in {"y", "yes"}:
+            confirm = _read_line(f"Delete '{selected}'? This cannot be undone. (y/n): ").strip().casefold()
+            if confirm not in _YES:
                 print("Delete canceled.")
                 continue
             try:
@@ -291,30 +328,45 @@ def _load_career() -> CareerState | None:
         return None
 
 
-def _save_career(state: CareerState) -> None:
+@lru_cache(maxsize=1)
+def _session_cwd() -> str:
+    """Working directory captured once; the CLI never changes it."""
+    return os.getcwd()
+
+
+def _display_path(path: Path) -> str:
+    try:
+        return os.path.relpath(path, _session_cwd())
+    except ValueError:
+        # Windows: save directory on a different drive than the cwd.
+        return str(path)
+
+
+def _checkpoint_rng(state: CareerState, rng: random.Random) -> None:
+    """Reseed from a fresh draw stored on the state so a save replays from here."""
+    state.rng_seed = rng.getrandbits(64)
+    rng.seed(state.rng_seed)
+
+
+def _save_career(state: CareerState, rng: random.Random) -> None:
     default_slot = state.boxer.profile.name.lower().replace(" ", "_")
-    slot = input(f"Save slot [{default_slot}]: ").strip() or default_slot
+    slot = _read_line(f"Save slot [{default_slot}]: ").strip() or default_slot
 
+    # Every action draws from rng, so checkpoint it into the snapshot.
+    _checkpoint_rng(state, rng)
     try:
         path = save_state(state, slot)
     except SavegameError as exc:
         print(f"Save failed: {exc}")
         return
-
-    resolved = Path(path).resolve()
-    try:
-        display_path = resolved.relative_to(Path.cwd())
-    except ValueError:
-        display_path = resolved
-    print(f"Saved to {display_path}")
+    print(f"Saved to {_display_path(path)}")
 
 
-def _run_training(state: CareerState) -> None:
+def _run_training(state: CareerState, rng: random.Random) -> None:
     if state.is_retired:
         print("Career is retired. Training is unavailable.")
         return
-    rules = load_rule_set("attribute_model")
-    focuses = rules["training_focuses"]
+    focuses = training_focuses()
 
     print("\nTraining focuses:")
     for idx, focus in enumerate(focuses, start=1):
@@ -324,7 +376,7 @@ def _run_training(state: CareerState) -> None:
     focus = focuses[choice - 1]
 
     details = apply_standard_training(state, focus)
-    _advance_month(state)
+    _advance_month(state, rng=rng)
 
     print(
         f"Training complete. Focus improved: {focus} | "
@@ -333,7 +385,7 @@ def _run_training(state: CareerState) -> None:
     )
 
 
-def _run_special_camp(state: CareerState) -> None:
+def _run_special_camp(state: CareerState, rng: random.Random) -> None:
     if state.is_retired:
         print("Career is retired. Training camp is unavailable.")
         return
@@ -341,8 +393,7 @@ def _run_special_camp(state: CareerState) -> None:
         print("Special camp is available only in pro career.")
         return
 
-    rules = load_rule_set("attribute_model")
-    focuses = rules["training_focuses"]
+    focuses = training_focuses()
     print("\nSpecial Camp focuses:")
     for idx, focus in enumerate(focuses, start=1):
         print(f"{idx}. {focus}")
@@ -356,7 +407,7 @@ def _run_special_camp(state: CareerState) -> None:
         print(exc)
         return
 
-    _advance_month(state, months=int(details["months"]))
+    _advance_month(state, months=int(details["months"]), rng=rng)
     print(
         (
             f"Special camp complete ({focus}). Cost ${details['cost']:,.2f} | "
@@ -367,7 +418,7 @@ def _run_special_camp(state: CareerState) -> None:
     )
 
 
-def _run_medical_recovery(state: CareerState) -> None:
+def _run_medical_recovery(state: CareerState, rng: random.Random) -> None:
     if state.is_retired:
         print("Career is retired. Medical recovery is unavailable.")
         return
@@ -380,7 +431,7 @@ def _run_medical_recovery(state: CareerState) -> None:
         print(exc)
         return
 
-    _advance_month(state, months=int(details["months"]))
+    _advance_month(state, months=int(details["months"]), rng=rng)
     print(
         (
             f"Medical recovery complete. Cost ${details['cost']:,.2f} | "
@@ -446,8 +497,8 @@ def _run_amateur_fight(state: CareerState, rng: random.Random) -> None:
         f"Height/Weight: {opponent.height_ft}'{opponent.height_in}\" / {opponent.weight_lbs} lbs | {opponent.stance}"
     )
 
-    confirm = input("Accept fight? (y/n): ").strip().lower()
-    if confirm not in {"y", "yes"}:
+    confirm = _read_line("Accept fight? (y/n): ").strip().casefold()
+    if confirm not in _YES:
         print("Fight declined.")
         return
 
@@ -464,19 +515,19 @@ def _run_amateur_fight(state: CareerState, rng: random.Random) -> None:
     experience = boxer_experience_profile(state.boxer, pro_record=state.pro_career.record)
     _advance_month(state, rng=rng)
 
-    print("\n== Fight Result ==")
-    print(f"Winner: {result.winner}")
-    print(f"Method: {result.method}")
-    print(f"Rounds Completed: {result.rounds_completed}")
-    print(f"Experience gained: +{xp_gain} XP ({experience.title})")
-
-    if result.scorecards:
-        for idx, score in enumerate(result.scorecards, start=1):
-            print(f"Judge {idx}: {score}")
-
-    print("Round log:")
-    for line in result.round_log:
-        print(f"  - {line}")
+    out = [
+        "\n== Fight Result ==",
+        f"Winner: {result.winner}",
+        f"Method: {result.method}",
+        f"Rounds Completed: {result.rounds_completed}",
+        f"Experience gained: +{xp_gain} XP ({experience.title})",
+    ]
+    out.extend(
+        f"Judge {idx}: {score}" for idx, score in enumerate(result.scorecards, start=1)
+    )
+    out.append("Round log:")
+    out.extend(f"  - {line}" for line in result.round_log)
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def _run_pro_fight(state: CareerState, rng: random.Random) -> None:
@@ -520,8 +571,8 @@ def _run_pro_fight(state: CareerState, rng: random.Random) -> None:
     if sanctioned_text:
         print(f"Sanctioned Bodies: {sanctioned_text}")
 
-    confirm = input("Accept pro fight? (y/n): ").strip().lower()
-    if confirm not in {"y", "yes"}:
+    confirm = _read_line("Accept pro fight? (y/n): ").strip().casefold()
+    if confirm not in _YES:
         print("Fight declined.")
         return
 
@@ -538,32 +589,57 @@ def _run_pro_fight(state: CareerState, rng: random.Random) -> None:
     experience = boxer_experience_profile(state.boxer, pro_record=state.pro_career.record)
     _advance_month(state, rng=rng)
 
-    print("\n== Pro Fight Result ==")
-    print(f"Winner: {result.winner}")
-    print(f"Method: {result.method}")
-    print(f"Rounds Completed: {result.rounds_completed}")
-    rank_label = f"#{new_rank}" if new_rank is not None else "Unranked"
-    print(f"{state.pro_career.organization_focus} Rank: {rank_label}")
+    out = [
+        "\n== Pro Fight Result ==",
+        f"Winner: {result.winner}",
+        f"Method: {result.method}",
+        f"Rounds Completed: {result.rounds_completed}",
+        f"{state.pro_career.organization_focus} Rank: {_rank_label(new_rank)}",
+    ]
     if isinstance(sanctioned, list) and sanctioned:
-        print(f"Sanctioned Bodies: {', '.join(str(item) for item in sanctioned)}")
-    print(f"Balance: ${state.pro_career.purse_balance:,.2f}")
-    print(f"Experience gained: +{xp_gain} XP ({experience.title})")
+        out.append(f"Sanctioned Bodies: {', '.join(str(item) for item in sanctioned)}")
+    out.append(f"Balance: ${state.pro_career.purse_balance:,.2f}")
+    out.append(f"Experience gained: +{xp_gain} XP ({experience.title})")
     if state.history and state.history[-1].notes:
-        print(f"Lineal: {state.history[-1].notes}")
+        out.append(f"Lineal: {state.history[-1].notes}")
+    sys.stdout.write("\n".join(out) + "\n")
 
 
-def _rest(state: CareerState) -> None:
+def _rest(state: CareerState, rng: random.Random) -> None:
     if state.is_retired:
         print("Career is retired. Rest action is unavailable.")
         return
     details = apply_rest_month(state)
-    _advance_month(state)
+    _advance_month(state, rng=rng)
     print(
         "Recovery month completed. "
         f"Fatigue -{details['fatigue_reduced']} | Injury Risk -{details['injury_risk_reduced']}"
     )
 
 
+def _rest_multiple(state: CareerState, rng: random.Random) -> None:
+    if state.is_retired:
+        print("Career is retired. Rest action is unavailable.")
+        return
+    months = _prompt_int("Months to rest (1-12): ", 1, 12)
+
+    fatigue_reduced = 0
+    injury_risk_reduced = 0
+    months_rested = 0
+    for _ in range(months):
+        details = apply_rest_month(state)
+        fatigue_reduced += details["fatigue_reduced"]
+        injury_risk_reduced += details["injury_risk_reduced"]
+        months_rested += 1
+        if _advance_month(state, rng=rng):
+            break
+
+    print(
+        f"Recovery block completed ({months_rested} months). "
+        f"Fatigue -{fatigue_reduced} | Injury Risk -{injury_risk_reduced}"
+    )
+
+
 def _turn_pro(state: CareerState, rng: random.Random) -> None:
     if state.is_retired:
         print("Career is retired. Turning pro is unavailable.")
@@ -616,27 +692,95 @@ def _change_division(state: CareerState, rng: random.Random) -> None:
         print(f"Vacated organization titles: {int(result['vacated_org_titles'])}.")
 
 
+_RETIRED_HEADER = "\n=== Career Month {month}, Year {year} | Age {age} | RETIRED ==="
+_CAREER_HEADER = (
+    "\n=== Career Month {month}, Year {year} | "
+    "Age {age} | Tier: {tier} | Record: {record} ==="
+)
+
+
+MenuAction = Callable[[CareerState, random.Random], None]
+
+# (label, handler) per menu entry, in display order; a ``None`` handler
+# returns to the main menu.  Dispatch tables and menu text derive from these.
+# New entries go at the end so existing option numbers stay stable.
+_PRO_MENU_ITEMS: tuple[tuple[str, MenuAction | None], ...] = (
+    ("View boxer", lambda state, rng: _render_stats(state)),
+    ("Train", _run_training),
+    ("Take pro fight", _run_pro_fight),
+    ("Change division", _change_division),
+    ("Special training camp", _run_special_camp),
+    ("Medical recovery", _run_medical_recovery),
+    ("Hire/upgrade staff", lambda state, rng: _run_staff_upgrade(state)),
+    ("Rest month", _rest),
+    ("Save game", _save_career),
+    ("Back to main menu", None),
+    ("Rest multiple months", _rest_multiple),
+)
+_AMATEUR_MENU_ITEMS: tuple[tuple[str, MenuAction | None], ...] = (
+    ("View boxer", lambda state, rng: _render_stats(state)),
+    ("Train", _run_training),
+    ("Take amateur fight", _run_amateur_fight),
+    ("Turn pro", _turn_pro),
+    ("Rest month", _rest),
+    ("Save game", _save_career),
+    ("Back to main menu", None),
+    ("Rest multiple months", _rest_multiple),
+)
+_RETIRED_MENU_ITEMS: tuple[tuple[str, MenuAction | None], ...] = (
+    ("View boxer", lambda state, rng: _render_stats(state)),
+    ("Save game", _save_career),
+    ("Back to main menu", None),
+)
+
+
+def _menu_text(items: tuple[tuple[str, MenuAction | None], ...]) -> str:
+    return "".join(f"{idx}. {label}\n" for idx, (label, _) in enumerate(items, start=1))
+
+
+def _menu_actions(
+    items: tuple[tuple[str, MenuAction | None], ...],
+) -> dict[int, MenuAction | None]:
+    return {idx: handler for idx, (_, handler) in enumerate(items, start=1)}
+
+
+_PRO_MENU = _menu_text(_PRO_MENU_ITEMS)
+_PRO_ACTIONS = _menu_actions(_PRO_MENU_ITEMS)
+_AMATEUR_MENU = _menu_text(_AMATEUR_MENU_ITEMS)
+_AMATEUR_ACTIONS = _menu_actions(_AMATEUR_MENU_ITEMS)
+_RETIRED_MENU = _menu_text(_RETIRED_MENU_ITEMS)
+_RETIRED_ACTIONS = _menu_actions(_RETIRED_MENU_ITEMS)
+
+
+def _dispatch(
+    state: CareerState,
+    rng: random.Random,
+    menu: str,
+    actions: dict[int, MenuAction | None],
+) -> bool:
+    """Show *menu*, run the chosen action; return False to leave the loop."""
+    sys.stdout.write(menu)
+    action = actions[_prompt_int("Choose action: ", 1, len(actions))]
+    if action is None:
+        return False
+    action(state, rng)
+    return True
+
+
 def _career_loop(state: CareerState) -> None:
-    rng = random.Random()
+    rng = random.Random(state.rng_seed)
 
     while True:
         if state.is_retired:
             print(
-                f"\n=== Career Month {state.month}, Year {state.year} | "
-                f"Age {state.boxer.profile.age} | RETIRED ==="
+                _RETIRED_HEADER.format_map(
+                    {"month": state.month, "year": state.year, "age": state.boxer.profile.age}
+                )
             )
             if state.retirement_reason:
                 print(state.retirement_reason)
 
-            print("1. View boxer")
-            print("2. Save game")
-            print("3. Back to main menu")
-            choice = _prompt_int("Choose action: ", 1, 3)
-            if choice == 1:
-                _render_stats(state)
-            elif choice == 2:
-                _save_career(state)
-            elif choice == 3:
+            if not _dispatch(state, rng, _RETIRED_MENU, _RETIRED_ACTIONS):
                 return
             continue
 
@@ -652,8 +796,15 @@ def _career_loop(state: CareerState) -> None:
             record_label = f"{record.wins}-{record.losses}-{record.draws}"
 
         print(
-            f"\n=== Career Month {state.month}, Year {state.year} | "
-            f"Age {state.boxer.profile.age} | Tier: {tier_label} | Record: {record_label} ==="
+            _CAREER_HEADER.format_map(
+                {
+                    "month": state.month,
+                    "year": state.year,
+                    "age": state.boxer.profile.age,
+                    "tier": tier_label,
+                    "record": record_label,
+                }
+            )
         )
 
         if not state.pro_career.is_active:
@@ -669,64 +820,11 @@ def _career_loop(state: CareerState) -> None:
                 )
 
         if state.pro_career.is_active:
-            print("1. View boxer")
-            print("2. Train")
-            print("3. Take pro fight")
-            print("4. Change division")
-            print("5. Special training camp")
-            print("6. Medical recovery")
-            print("7. Hire/upgrade staff")
-            print("8. Rest month")
-            print("9. Save game")
-            print("10. Back to main menu")
-
-            choice = _prompt_int("Choose action: ", 1, 10)
-
-            if choice == 1:
-                _render_stats(state)
-            elif choice == 2:
-                _run_training(state)
-            elif choice == 3:
-                _run_pro_fight(state, rng)
-            elif choice == 4:
-                _change_division(state, rng)
-            elif choice == 5:
-                _run_special_camp(state)
-            elif choice == 6:
-                _run_medical_recovery(state)
-            elif choice == 7:
-                _run_staff_upgrade(state)
-            elif choice == 8:
-                _rest(state)
-            elif choice == 9:
-                _save_career(state)
-            elif choice == 10:
-                return
+            menu, actions = _PRO_MENU, _PRO_ACTIONS
         else:
-            print("1. View boxer")
-            print("2. Train")
-            print("3. Take amateur fight")
-            print("4. Turn pro")
-            print("5. Rest month")
-            print("6. Save game")
-            print("7. Back to main menu")
-
-            choice = _prompt_int("Choose action: ", 1, 7)
-
-            if choice == 1:
-                _render_stats(state)
-            elif choice == 2:
-                _run_training(state)
-            elif choice == 3:
-                _run_amateur_fight(state, rng)
-            elif choice == 4:
-                _turn_pro(state, rng)
-            elif choice == 5:
-                _rest(state)
-            elif choice == 6:
-                _save_career(state)
-            elif choice == 7:
-                return
+            menu, actions = _AMATEUR_MENU, _AMATEUR_ACTIONS
+        if not _dispatch(state, rng, menu, actions):
+            return
 
 
 def run() -> None:
@@ -7,9 +7,12 @@ boxer creation, fight offers, rankings, save management, and world news.
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from functools import lru_cache, partial
+from operator import attrgetter
 import random
 import sys
 from pathlib import Path
+from typing import Callable
 
 
 def _bootstrap_vendor_path() -> None:
@@ -24,7 +27,19 @@ def _bootstrap_vendor_path() -> None:
 _bootstrap_vendor_path()
 
 try:
-    from PySide6.QtCore import Qt
+    from PySide6.QtCore import (
+        QAbstractTableModel,
+        QModelIndex,
+        QObject,
+        QPersistentModelIndex,
+        QRunnable,
+        Qt,
+        QThreadPool,
+        QTimer,
+        Signal,
+        Slot,
+    )
+    from PySide6.QtGui import QFont, QTextCursor
     from PySide6.QtWidgets import (  # noqa: E402
         QAbstractItemView,
         QApplication,
@@ -32,6 +47,7 @@ try:
         QFormLayout,
         QFrame,
         QHBoxLayout,
+        QHeaderView,
         QInputDialog,
         QLabel,
         QLineEdit,
@@ -41,8 +57,7 @@ try:
         QPushButton,
         QSpinBox,
         QStackedWidget,
-        QTableWidget,
-        QTableWidgetItem,
+        QTableView,
         QVBoxLayout,
         QWidget,
     )
@@ -53,13 +68,14 @@ except ModuleNotFoundError as exc:  # pragma: no cover
     ) from exc
 
 from boxing_game.constants import ORGANIZATION_NAMES
-from boxing_game.models import CareerState
+from boxing_game.models import CareerState, FightHistoryEntry, ProCareer
 from boxing_game.modules.amateur_circuit import (
     apply_fight_result,
     current_tier,
     generate_opponent,
     pro_readiness_status,
 )
+from boxing_game.modules.attribute_engine import training_focuses
 from boxing_game.modules.career_clock import advance_month
 from boxing_game.modules.experience_engine import boxer_experience_profile, total_career_fights
 from boxing_game.modules.fight_sim_engine import simulate_amateur_fight, simulate_pro_fight
@@ -75,6 +91,8 @@ from boxing_game.modules.pro_career import (
     format_purse_breakdown,
     generate_pro_opponent,
     offer_purse,
+    organization_division_champion,
+    organization_division_defenses,
     player_lineal_division,
     player_pound_for_pound_position,
     pound_for_pound_snapshot,
@@ -105,7 +123,244 @@ from boxing_game.modules.savegame import (
     save_state,
 )
 from boxing_game.modules.world_sim import simulate_world_month
-from boxing_game.rules_registry import load_rule_set
+
+# Qt enum values used across page builders, dialogs and the table model.
+_DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+_FONT_ROLE = Qt.ItemDataRole.FontRole
+_HORIZONTAL = Qt.Orientation.Horizontal
+_ALIGN_RIGHT = Qt.AlignmentFlag.AlignRight
+_STYLED_PANEL = QFrame.Shape.StyledPanel
+_NO_EDIT = QAbstractItemView.EditTrigger.NoEditTriggers
+_SELECT_ROWS = QAbstractItemView.SelectionBehavior.SelectRows
+_SINGLE_SELECTION = QAbstractItemView.SelectionMode.SingleSelection
+_RESIZE_TO_CONTENTS = QHeaderView.ResizeMode.ResizeToContents
+_YES = QMessageBox.StandardButton.Yes
+_NO = QMessageBox.StandardButton.No
+_YES_NO = _YES | _NO
+
+_SAVE_ACTIONS = ("Load", "Delete")
+_HISTORY_TAIL = 12
+# Combo selections landing within this window (e.g. arrow-key scrolling)
+# share one rebuild.
+_SELECTION_DEBOUNCE_MS = 50
+
+
+def _fmt_money(value: float) -> str:
+    """Format a dollar amount the same way across dialogs and logs."""
+    return f"${value:,.2f}"
+
+
+def _history_line(entry: FightHistoryEntry) -> str:
+    purse_label = f" | purse {_fmt_money(entry.purse)}" if entry.stage == "pro" else ""
+    notes_label = f" | {entry.notes}" if entry.notes else ""
+    return (
+        f"[{entry.stage}] vs {entry.opponent_name} (rating {entry.opponent_rating}) | "
+        f"{entry.result.method} | winner: {entry.result.winner}{purse_label}{notes_label}"
+    )
+
+
+@lru_cache(maxsize=1)
+def _training_focus_labels() -> tuple[tuple[str, str], ...]:
+    return tuple((focus, focus.replace("_", " ").title()) for focus in training_focuses())
+
+
+@lru_cache(maxsize=256)
+def _format_saved_at(saved_at: str) -> str:
+    if not saved_at:
+        return "Unknown"
+    try:
+        parsed = datetime.fromisoformat(saved_at)
+    except ValueError:
+        return saved_at
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    local_dt = parsed.astimezone()
+    return local_dt.strftime("%Y-%m-%d %H:%M:%S %Z")
+
+
+RankingsRow = RankingEntry | PoundForPoundEntry
+
+
+def _name_cell(entry: RankingsRow) -> str:
+    return f"{entry.name} (YOU)" if entry.is_player else entry.name
+
+
+def _record_cell(entry: RankingsRow) -> str:
+    return f"{entry.wins}-{entry.losses}-{entry.draws}"
+
+
+def _lineal_cell(entry: RankingsRow) -> str:
+    return "Yes" if entry.is_lineal_champion else ""
+
+
+CellFormatter = Callable[[RankingsRow], str]
+
+# (header, formatter) per column; headers and cell text are derived from these.
+_P4P_COLUMNS: tuple[tuple[str, CellFormatter], ...] = (
+    ("Rank", lambda entry: f"#{entry.rank}"),
+    ("Name", _name_cell),
+    ("Division", attrgetter("division")),
+    ("Score", lambda entry: f"{entry.score:.2f}"),
+    ("OVR", lambda entry: str(entry.rating)),
+    ("Record", _record_cell),
+    ("Lineal", _lineal_cell),
+)
+_ORG_COLUMNS: tuple[tuple[str, CellFormatter], ...] = (
+    ("Rank", lambda entry: f"#{entry.rank}" if entry.rank > 0 else "NR"),
+    ("Name", _name_cell),
+    ("OVR", lambda entry: str(entry.rating)),
+    ("Record", _record_cell),
+    ("Age", lambda entry: str(entry.age)),
+    ("Stance", attrgetter("stance")),
+    ("Lineal", _lineal_cell),
+)
+
+
+def _p4p_details(entry: PoundForPoundEntry) -> str:
+    return (
+        f"Name: {entry.name}\n"
+        f"P4P Rank: #{entry.rank}\n"
+        f"P4P Score: {entry.score:.2f}\n"
+        f"Division: {entry.division}\n"
+        f"Overall Rating: {entry.rating}\n"
+        f"Record: {entry.wins}-{entry.losses}-{entry.draws}\n"
+        f"Lineal Champion: {'Yes' if entry.is_lineal_champion else 'No'}\n"
+        f"Player Boxer: {'Yes' if entry.is_player else 'No'}"
+    )
+
+
+def _org_details(entry: RankingEntry) -> str:
+    return (
+        f"Name: {entry.name}\n"
+        f"Ranking: {f'#{entry.rank}' if entry.rank > 0 else 'NR'}\n"
+        f"Division: {entry.division}\n"
+        f"Overall Rating: {entry.rating}\n"
+        f"Record: {entry.wins}-{entry.losses}-{entry.draws}\n"
+        f"Age: {entry.age}\n"
+        f"Stance: {entry.stance}\n"
+        f"Lineal Champion: {'Yes' if entry.is_lineal_champion else 'No'}\n"
+        f"Player Boxer: {'Yes' if entry.is_player else 'No'}"
+    )
+
+
+class RankingsTableModel(QAbstractTableModel):
+    """Read-only table model over a rankings or pound-for-pound snapshot.
+
+    Cell text is formatted on first display and cached per row, so a
+    refresh costs one model reset rather than one item per cell.
+    """
+
+    def __init__(self, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self._rows: list[RankingsRow] = []
+        self._headers: tuple[str, ...] = ()
+        self._formatters: tuple[CellFormatter, ...] = ()
+        self._columns: tuple[tuple[str, CellFormatter], ...] | None = None
+        self._format_details: Callable[[RankingsRow], str] = _org_details
+        self._cells: list[tuple[str, ...] | None] = []
+        self._player_font = QFont()
+        self._player_font.setBold(True)
+
+    def set_rows(self, rows: list[RankingsRow], *, pound_for_pound: bool) -> None:
+        columns = _P4P_COLUMNS if pound_for_pound else _ORG_COLUMNS
+        if columns is self._columns and len(rows) == len(self._rows):
+            # Same layout: refresh cell text without resetting headers or rows.
+            self._rows = list(rows)
+            self._cells = [None] * len(self._rows)
+            if self._rows:
+                self.dataChanged.emit(
+                    self.index(0, 0),
+                    self.index(len(self._rows) - 1, len(self._headers) - 1),
+                )
+            return
+
+        self.beginResetModel()
+        self._rows = list(rows)
+        self._columns = columns
+        self._format_details = _p4p_details if pound_for_pound else _org_details
+        self._headers = tuple(header for header, _ in columns)
+        self._formatters = tuple(formatter for _, formatter in columns)
+        self._cells = [None] * len(self._rows)
+        self.endResetModel()
+
+    def clear(self) -> None:
+        self.beginResetModel()
+        self._rows = []
+        self._headers = ()
+        self._columns = None
+        self._cells = []
+        self.endResetModel()
+
+    def entry(self, row: int) -> RankingsRow | None:
+        if 0 <= row < len(self._rows):
+            return self._rows[row]
+        return None
+
+    def details(self, row: int) -> str | None:
+        """Return the detail-panel text for *row*, or None when out of range."""
+        if 0 <= row < len(self._rows):
+            return self._format_details(self._rows[row])
+        return None
+
+    def rowCount(self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._headers)
+
+    def data(
+        self,
+        index: QModelIndex | QPersistentModelIndex,
+        role: int = _DISPLAY_ROLE,
+    ) -> object:
+        if not index.isValid():
+            return None
+        row = index.row()
+        if role == _FONT_ROLE:
+            return self._player_font if self._rows[row].is_player else None
+        if role != _DISPLAY_ROLE:
+            return None
+        cells = self._cells[row]
+        if cells is None:
+            entry = self._rows[row]
+            cells = tuple(formatter(entry) for formatter in self._formatters)
+            self._cells[row] = cells
+        return cells[index.column()]
+
+    def headerData(
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = _DISPLAY_ROLE,
+    ) -> object:
+        if role != _DISPLAY_ROLE or orientation != _HORIZONTAL:
+            return None
+        if 0 <= section < len(self._headers):
+            return self._headers[section]
+        return None
+
+
+class WorkerSignals(QObject):
+    finished = Signal()
+
+
+class SaveScanWorker(QRunnable):
+    """Read save-slot metadata on a thread-pool thread."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.setAutoDelete(False)
+        self.signals = WorkerSignals()
+        self.metadata: list[SaveMetadata] = []
+        self.error: Exception | None = None
+
+    def run(self) -> None:
+        try:
+            self.metadata = list_save_metadata()
+        except Exception as exc:  # reported on the GUI thread
+            self.error = exc
+        finally:
+            self.signals.finished.emit()
 
 
 class BoxingGameWindow(QMainWindow):
@@ -116,22 +371,27 @@ class BoxingGameWindow(QMainWindow):
 
         self.rng = random.Random()
         self.state: CareerState | None = None
-        self._rankings_rows: list[RankingEntry | PoundForPoundEntry] = []
 
         self.stack = QStackedWidget()
         self.setCentralWidget(self.stack)
 
         self.menu_page = self._build_menu_page()
-        self.create_page = self._build_create_page()
-        self.career_page = self._build_career_page()
-        self.rankings_page = self._build_rankings_page()
-        self.manage_saves_page = self._build_manage_saves_page()
+        # Built on first use; see the _ensure_*_page helpers.
+        self.create_page: QWidget | None = None
+        self.career_page: QWidget | None = None
+        self.rankings_page: QWidget | None = None
+        self.manage_saves_page: QWidget | None = None
+        self._career_refresh_pending = False
+        self._rankings_refresh_pending = False
+        self._manage_details_pending = False
+        self._pending_log: list[str] = []
+        self._view_texts: dict[QPlainTextEdit, str] = {}
+        self._history_shown: tuple[list[FightHistoryEntry], int] | None = None
+        self._staff_lines: tuple[tuple[tuple[str, int], ...], list[str]] | None = None
+        self._divisions_label: tuple[list[str], int, str] | None = None
+        self._scroll_log_on_flush = False
 
         self.stack.addWidget(self.menu_page)
-        self.stack.addWidget(self.create_page)
-        self.stack.addWidget(self.career_page)
-        self.stack.addWidget(self.rankings_page)
-        self.stack.addWidget(self.manage_saves_page)
         self.stack.setCurrentWidget(self.menu_page)
 
     def _build_menu_page(self) -> QWidget:
@@ -179,10 +439,10 @@ class BoxingGameWindow(QMainWindow):
         layout.addWidget(title)
 
         form_card = QFrame()
-        form_card.setFrameShape(QFrame.Shape.StyledPanel)
+        form_card.setFrameShape(_STYLED_PANEL)
         form_card.setStyleSheet("QFrame { padding: 8px; }")
         form_layout = QFormLayout(form_card)
-        form_layout.setLabelAlignment(Qt.AlignmentFlag.AlignRight)
+        form_layout.setLabelAlignment(_ALIGN_RIGHT)
         form_layout.setVerticalSpacing(12)
         form_layout.setHorizontalSpacing(16)
 
@@ -258,11 +518,13 @@ class BoxingGameWindow(QMainWindow):
 
         self.stats_view = QPlainTextEdit()
         self.stats_view.setReadOnly(True)
+        self.stats_view.setUndoRedoEnabled(False)
+        self.stats_view.setMaximumBlockCount(2000)
         self.stats_view.setPlaceholderText("Stats")
         stats_and_train.addWidget(self.stats_view, 3)
 
         self.training_panel = QFrame()
-        self.training_panel.setFrameShape(QFrame.Shape.StyledPanel)
+        self.training_panel.setFrameShape(_STYLED_PANEL)
         training_layout = QVBoxLayout(self.training_panel)
         training_layout.setContentsMargins(8, 8, 8, 8)
         training_layout.setSpacing(6)
@@ -277,13 +539,11 @@ class BoxingGameWindow(QMainWindow):
         training_layout.addWidget(training_hint)
 
         self.training_focus_buttons: dict[str, QPushButton] = {}
-        focuses = [str(item) for item in load_rule_set("attribute_model")["training_focuses"]]
-        for focus in focuses:
-            button = QPushButton(focus.replace("_", " ").title())
+        for focus, label in _training_focus_labels():
+            button = QPushButton(label)
             button.setMinimumHeight(32)
-            button.clicked.connect(
-                lambda _checked=False, selected_focus=focus: self._train_focus(selected_focus)
-            )
+            button.setProperty("trainingFocus", focus)
+            button.clicked.connect(self._train_focus_clicked)
             self.training_focus_buttons[focus] = button
             training_layout.addWidget(button)
 
@@ -292,6 +552,9 @@ class BoxingGameWindow(QMainWindow):
 
         self.history_view = QPlainTextEdit()
         self.history_view.setReadOnly(True)
+        self.history_view.setUndoRedoEnabled(False)
+        # One block per history entry; the view shows the most recent fights.
+        self.history_view.setMaximumBlockCount(_HISTORY_TAIL)
         self.history_view.setPlaceholderText("Fight history")
 
         content_row.addLayout(stats_and_train, 2)
@@ -342,17 +605,32 @@ class BoxingGameWindow(QMainWindow):
 
         root.addLayout(button_row)
 
+        # (button, stage requirement) pairs driven by _update_action_buttons.
+        self._stage_buttons: tuple[tuple[QPushButton, str], ...] = (
+            (self.amateur_fight_button, "amateur"),
+            (self.turn_pro_button, "pro_ready"),
+            (self.pro_fight_button, "pro"),
+            (self.change_division_button, "pro"),
+            (self.special_camp_button, "pro"),
+            (self.medical_button, "pro"),
+            (self.staff_button, "pro"),
+            (self.rest_button, "any"),
+            *((button, "any") for button in self.training_focus_buttons.values()),
+        )
+
         log_row = QHBoxLayout()
         log_row.setSpacing(10)
 
         self.event_log = QPlainTextEdit()
         self.event_log.setReadOnly(True)
+        self.event_log.setUndoRedoEnabled(False)
         self.event_log.setMaximumBlockCount(500)
         self.event_log.setPlaceholderText("Event log")
 
         self.world_news_view = QPlainTextEdit()
         self.world_news_view.setReadOnly(True)
-        self.world_news_view.setMaximumBlockCount(300)
+        self.world_news_view.setUndoRedoEnabled(False)
+        self.world_news_view.setMaximumBlockCount(16)
         self.world_news_view.setPlaceholderText("World news")
 
         log_row.addWidget(self.event_log, 3)
@@ -380,10 +658,10 @@ class BoxingGameWindow(QMainWindow):
         controls.setSpacing(8)
         self.rankings_org_combo = QComboBox()
         self.rankings_org_combo.addItems([*ORGANIZATION_NAMES, "P4P"])
-        self.rankings_org_combo.currentTextChanged.connect(self._refresh_rankings_page)
+        self.rankings_org_combo.currentTextChanged.connect(self._schedule_rankings_refresh)
 
         refresh_button = QPushButton("Refresh")
-        refresh_button.clicked.connect(self._refresh_rankings_page)
+        refresh_button.clicked.connect(self._schedule_rankings_refresh)
 
         back_button = QPushButton("Back to Career")
         back_button.clicked.connect(self._show_career_page)
@@ -398,15 +676,23 @@ class BoxingGameWindow(QMainWindow):
         table_and_detail = QHBoxLayout()
         table_and_detail.setSpacing(10)
 
-        self.rankings_table = QTableWidget()
-        self.rankings_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
-        self.rankings_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
-        self.rankings_table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self._rankings_model = RankingsTableModel(self)
+        self.rankings_table = QTableView()
+        self.rankings_table.setModel(self._rankings_model)
+        self.rankings_table.setEditTriggers(_NO_EDIT)
+        self.rankings_table.setSelectionBehavior(_SELECT_ROWS)
+        self.rankings_table.setSelectionMode(_SINGLE_SELECTION)
         self.rankings_table.verticalHeader().setVisible(False)
-        self.rankings_table.itemSelectionChanged.connect(self._on_ranking_row_selected)
+        # Columns track their contents as the model changes; no explicit resize pass.
+        self.rankings_table.horizontalHeader().setSectionResizeMode(_RESIZE_TO_CONTENTS)
+        self.rankings_table.selectionModel().currentRowChanged.connect(
+            self._on_ranking_row_selected
+        )
 
         self.rankings_details_view = QPlainTextEdit()
         self.rankings_details_view.setReadOnly(True)
+        self.rankings_details_view.setUndoRedoEnabled(False)
+        self.rankings_details_view.setMaximumBlockCount(2000)
         self.rankings_details_view.setPlaceholderText("Select a boxer to view details.")
 
         table_and_detail.addWidget(self.rankings_table, 3)
@@ -434,7 +720,9 @@ class BoxingGameWindow(QMainWindow):
 
         controls.addWidget(QLabel("Save Slot"))
         self.manage_saves_slot_combo = QComboBox()
-        self.manage_saves_slot_combo.currentTextChanged.connect(self._refresh_manage_save_details)
+        self.manage_saves_slot_combo.currentTextChanged.connect(
+            self._schedule_manage_details_refresh
+        )
         controls.addWidget(self.manage_saves_slot_combo, 1)
 
         refresh_button = QPushButton("Refresh")
@@ -471,74 +759,150 @@ class BoxingGameWindow(QMainWindow):
 
         self.manage_saves_details_view = QPlainTextEdit()
         self.manage_saves_details_view.setReadOnly(True)
+        self.manage_saves_details_view.setUndoRedoEnabled(False)
+        self.manage_saves_details_view.setMaximumBlockCount(2000)
         self.manage_saves_details_view.setPlaceholderText("Save metadata will appear here.")
         layout.addWidget(self.manage_saves_details_view, 1)
 
         self._manage_save_by_slot: dict[str, SaveMetadata] = {}
+        self._save_scan: SaveScanWorker | None = None
         return page
 
+    def _ensure_create_page(self) -> QWidget:
+        if self.create_page is None:
+            self.create_page = self._build_create_page()
+            self.stack.addWidget(self.create_page)
+        return self.create_page
+
+    def _ensure_career_page(self) -> QWidget:
+        if self.career_page is None:
+            self.career_page = self._build_career_page()
+            self.stack.addWidget(self.career_page)
+        return self.career_page
+
+    def _ensure_rankings_page(self) -> QWidget:
+        if self.rankings_page is None:
+            self.rankings_page = self._build_rankings_page()
+            self.stack.addWidget(self.rankings_page)
+        return self.rankings_page
+
+    def _ensure_manage_saves_page(self) -> QWidget:
+        if self.manage_saves_page is None:
+            self.manage_saves_page = self._build_manage_saves_page()
+            self.stack.addWidget(self.manage_saves_page)
+        return self.manage_saves_page
+
+    @Slot()
     def _show_menu_page(self) -> None:
         self.stack.setCurrentWidget(self.menu_page)
 
+    @Slot()
     def _show_create_page(self) -> None:
-        self.stack.setCurrentWidget(self.create_page)
+        self.stack.setCurrentWidget(self._ensure_create_page())
 
+    @Slot()
     def _show_career_page(self) -> None:
         if self.state is None:
             return
+        page = self._ensure_career_page()
         self._refresh_career_view()
-        self.stack.setCurrentWidget(self.career_page)
+        self.stack.setCurrentWidget(page)
 
+    @Slot()
     def _show_rankings_page(self) -> None:
         if self.state is None:
             return
+        page = self._ensure_rankings_page()
         self._refresh_rankings_page()
-        self.stack.setCurrentWidget(self.rankings_page)
+        self.stack.setCurrentWidget(page)
 
+    @Slot()
     def _show_manage_saves_page(self) -> None:
+        page = self._ensure_manage_saves_page()
         self._refresh_manage_saves_page()
-        self.stack.setCurrentWidget(self.manage_saves_page)
+        self.stack.setCurrentWidget(page)
 
     def _set_state(self, state: CareerState) -> None:
         self.state = state
+        page = self._ensure_career_page()
         self._refresh_career_view()
-        self.stack.setCurrentWidget(self.career_page)
+        self.stack.setCurrentWidget(page)
 
     def _advance_month(self, months: int = 1) -> None:
         if self.state is None:
             return
+        events: list[str] = []
+        world_events: list[str] = []
+        retirement_reason: str | None = None
         for _ in range(months):
-            for event in advance_month(self.state, months=1):
-                self._append_log(event)
-            for world_event in simulate_world_month(self.state, rng=self.rng):
-                self._append_world_news(world_event)
+            events.extend(advance_month(self.state, months=1))
+            world_events.extend(simulate_world_month(self.state, rng=self.rng))
             retirement = evaluate_retirement(self.state, rng=self.rng)
             if retirement.newly_retired:
-                self._append_log(f"Retirement: {retirement.reason}")
-                QMessageBox.information(self, "Career Retired", retirement.reason)
+                events.append(f"Retirement: {retirement.reason}")
+                retirement_reason = retirement.reason
                 break
 
+        # Each log view relayouts once for the whole block.
+        self._append_log_many(events)
+        if world_events:
+            self._append_world_news("\n".join(world_events))
+        if retirement_reason is not None:
+            QMessageBox.information(self, "Career Retired", retirement_reason)
+
     def _append_log(self, message: str) -> None:
-        self.event_log.appendPlainText(message)
+        # Messages logged in one event-loop pass reach the view as one append.
+        self._pending_log.append(message)
+        if len(self._pending_log) == 1:
+            QTimer.singleShot(0, self._flush_log)
+
+    def _append_log_many(self, lines: list[str]) -> None:
+        if not lines:
+            return
+        self._append_log("\n".join(lines))
+        self._scroll_log_on_flush = True
+
+    @Slot()
+    def _flush_log(self) -> None:
+        if not self._pending_log:
+            return
+        self._ensure_career_page()
+        self.event_log.appendPlainText("\n".join(self._pending_log))
+        self._pending_log.clear()
+        if self._scroll_log_on_flush:
+            self._scroll_log_on_flush = False
+            self.event_log.moveCursor(QTextCursor.MoveOperation.End)
+
+    def _clear_event_log(self) -> None:
+        self._pending_log.clear()
+        self._scroll_log_on_flush = False
+        self.event_log.clear()
 
     def _append_world_news(self, message: str) -> None:
+        self._ensure_career_page()
+        self._view_texts.pop(self.world_news_view, None)
         self.world_news_view.appendPlainText(message)
 
+    def _set_view_text(self, view: QPlainTextEdit, text: str) -> None:
+        # Refreshes often rebuild identical text; skip the document relayout.
+        if self._view_texts.get(view) == text:
+            return
+        self._view_texts[view] = text
+        view.setPlainText(text)
+
     def _update_action_buttons(
         self, *, is_pro: bool, is_retired: bool, is_pro_ready: bool,
     ) -> None:
         """Enable/disable all career-page action buttons based on state."""
         can_act = not is_retired
-        self.amateur_fight_button.setEnabled(can_act and not is_pro)
-        self.turn_pro_button.setEnabled(can_act and not is_pro and is_pro_ready)
-        self.pro_fight_button.setEnabled(can_act and is_pro)
-        self.change_division_button.setEnabled(can_act and is_pro)
-        self.special_camp_button.setEnabled(can_act and is_pro)
-        self.medical_button.setEnabled(can_act and is_pro)
-        self.staff_button.setEnabled(can_act and is_pro)
-        self.rest_button.setEnabled(can_act)
-        for button in self.training_focus_buttons.values():
-            button.setEnabled(can_act)
+        allowed = {
+            "any": can_act,
+            "amateur": can_act and not is_pro,
+            "pro_ready": can_act and not is_pro and is_pro_ready,
+            "pro": can_act and is_pro,
+        }
+        for button, requirement in self._stage_buttons:
+            button.setEnabled(allowed[requirement])
 
     def _guard_retired_action(self, action_label: str) -> bool:
         if self.state is None or not self.state.is_retired:
@@ -551,32 +915,49 @@ class BoxingGameWindow(QMainWindow):
         )
         return True
 
-    def _format_saved_at(self, saved_at: str) -> str:
-        if not saved_at:
-            return "Unknown"
-        try:
-            parsed = datetime.fromisoformat(saved_at)
-        except ValueError:
-            return saved_at
-        if parsed.tzinfo is None:
-            parsed = parsed.replace(tzinfo=timezone.utc)
-        local_dt = parsed.astimezone()
-        return local_dt.strftime("%Y-%m-%d %H:%M:%S %Z")
-
     def _selected_manage_slot(self) -> str:
         return self.manage_saves_slot_combo.currentText().strip()
 
+    @Slot()
     def _refresh_manage_saves_page(self, preferred_slot: str | None = None) -> None:
+        # Parsing every save file can stall the window, so scan on the global
+        # pool; a newer scan supersedes any still in flight.
+        chosen = preferred_slot.strip() if preferred_slot else ""
+        worker = SaveScanWorker()
+        worker.signals.finished.connect(
+            partial(self._apply_save_scan, worker, chosen),
+            Qt.ConnectionType.QueuedConnection,
+        )
+        self._save_scan = worker
+        self._set_manage_actions_enabled(False)
+        QThreadPool.globalInstance().start(worker)
+
+    def _set_manage_actions_enabled(self, enabled: bool) -> None:
+        self.manage_load_button.setEnabled(enabled)
+        self.manage_rename_button.setEnabled(enabled)
+        self.manage_duplicate_button.setEnabled(enabled)
+        self.manage_delete_button.setEnabled(enabled)
+
+    def _apply_save_scan(self, worker: SaveScanWorker, chosen: str) -> None:
+        # Dropping the connection releases the partial's hold on the worker.
+        worker.signals.finished.disconnect()
+        if worker is not self._save_scan:
+            return
+        self._save_scan = None
+        if worker.error is not None:
+            # Keep the last good slot list so the page stays usable.
+            self.manage_saves_subtitle.setText("Could not read save slots.")
+            self._refresh_manage_save_details()
+            QMessageBox.critical(self, "Save Scan Failed", str(worker.error))
+            return
+
         previous_slot = self._selected_manage_slot()
-        metadata = list_save_metadata()
+        metadata = worker.metadata
         self._manage_save_by_slot = {item.slot: item for item in metadata}
 
         self.manage_saves_slot_combo.blockSignals(True)
-        self.manage_saves_slot_combo.clear()
-        for item in metadata:
-            self.manage_saves_slot_combo.addItem(item.slot)
+        self._reconcile_slot_combo([item.slot for item in metadata])
 
-        chosen = preferred_slot.strip() if preferred_slot else ""
         if not chosen:
             chosen = previous_slot
         if chosen and chosen in self._manage_save_by_slot:
@@ -589,28 +970,56 @@ class BoxingGameWindow(QMainWindow):
         self.manage_saves_subtitle.setText(f"Total save slots: {count}")
         self._refresh_manage_save_details()
 
+    def _reconcile_slot_combo(self, slots: list[str]) -> None:
+        # Touch only the combo items that moved, appeared or disappeared;
+        # an unchanged slot list leaves the combo alone.
+        combo = self.manage_saves_slot_combo
+        if [combo.itemText(i) for i in range(combo.count())] == slots:
+            return
+        wanted = set(slots)
+        for i in reversed(range(combo.count())):
+            if combo.itemText(i) not in wanted:
+                combo.removeItem(i)
+        for i, slot in enumerate(slots):
+            if combo.itemText(i) == slot:
+                continue
+            j = combo.findText(slot)
+            if j > i:
+                combo.removeItem(j)
+            combo.insertItem(i, slot)
+
+    @Slot()
+    def _schedule_manage_details_refresh(self, *_: object) -> None:
+        if self._manage_details_pending:
+            return
+        self._manage_details_pending = True
+        QTimer.singleShot(_SELECTION_DEBOUNCE_MS, self._run_scheduled_manage_details_refresh)
+
+    @Slot()
+    def _run_scheduled_manage_details_refresh(self) -> None:
+        self._manage_details_pending = False
+        self._refresh_manage_save_details()
+
+    @Slot()
     def _refresh_manage_save_details(self, *_: object) -> None:
         slot = self._selected_manage_slot()
         meta = self._manage_save_by_slot.get(slot)
         if meta is None:
-            self.manage_load_button.setEnabled(False)
-            self.manage_rename_button.setEnabled(False)
-            self.manage_duplicate_button.setEnabled(False)
-            self.manage_delete_button.setEnabled(False)
-            self.manage_saves_details_view.setPlainText("No saves available.")
+            self._set_manage_actions_enabled(False)
+            self._set_view_text(self.manage_saves_details_view, "No saves available.")
             return
 
-        self.manage_load_button.setEnabled(meta.is_valid)
-        self.manage_rename_button.setEnabled(True)
-        self.manage_duplicate_button.setEnabled(True)
-        self.manage_delete_button.setEnabled(True)
+        # Slot actions stay disabled until an in-flight scan lands.
+        self._set_manage_actions_enabled(self._save_scan is None)
+        if not meta.is_valid:
+            self.manage_load_button.setEnabled(False)
 
         stage = "Pro" if meta.is_pro else "Amateur"
         if meta.is_pro is None:
             stage = "Unknown"
         lines = [
             f"Slot: {meta.slot}",
-            f"Last Played: {self._format_saved_at(meta.saved_at)}",
+            f"Last Played: {_format_saved_at(meta.saved_at)}",
             f"Version: {meta.version if meta.version is not None else 'Unknown'}",
             f"Boxer: {meta.boxer_name or 'Unknown'}",
             f"Age: {meta.age if meta.age is not None else 'Unknown'}",
@@ -622,8 +1031,9 @@ class BoxingGameWindow(QMainWindow):
         ]
         if not meta.is_valid:
             lines.extend(["", f"Save Error: {meta.error or 'Unknown metadata error'}"])
-        self.manage_saves_details_view.setPlainText("\n".join(lines))
+        self._set_view_text(self.manage_saves_details_view, "\n".join(lines))
 
+    @Slot()
     def _load_selected_save_from_manage(self) -> None:
         slot = self._selected_manage_slot()
         if not slot:
@@ -638,11 +1048,13 @@ class BoxingGameWindow(QMainWindow):
             ensure_rankings(state)
 
         self._set_state(state)
-        self.event_log.clear()
-        self._append_log(f"Loaded save slot: {slot}")
+        self._clear_event_log()
+        lines = [f"Loaded save slot: {slot}"]
         if state.is_retired and state.retirement_reason:
-            self._append_log(f"Retired career loaded: {state.retirement_reason}")
+            lines.append(f"Retired career loaded: {state.retirement_reason}")
+        self._append_log_many(lines)
 
+    @Slot()
     def _rename_selected_save_from_manage(self) -> None:
         slot = self._selected_manage_slot()
         if not slot:
@@ -673,6 +1085,7 @@ class BoxingGameWindow(QMainWindow):
         self._append_log(f"Renamed save slot: {slot} -> {target}")
         self._refresh_manage_saves_page(preferred_slot=target)
 
+    @Slot()
     def _duplicate_selected_save_from_manage(self) -> None:
         slot = self._selected_manage_slot()
         if not slot:
@@ -703,6 +1116,7 @@ class BoxingGameWindow(QMainWindow):
         self._append_log(f"Duplicated save slot: {slot} -> {target}")
         self._refresh_manage_saves_page(preferred_slot=target)
 
+    @Slot()
     def _delete_selected_save_from_manage(self) -> None:
         slot = self._selected_manage_slot()
         if not slot:
@@ -712,10 +1126,10 @@ class BoxingGameWindow(QMainWindow):
             self,
             "Delete Save",
             f"Delete save slot '{slot}'? This cannot be undone.",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-            QMessageBox.StandardButton.No,
+            _YES_NO,
+            _NO,
         )
-        if confirm != QMessageBox.StandardButton.Yes:
+        if confirm != _YES:
             return
 
         try:
@@ -727,6 +1141,34 @@ class BoxingGameWindow(QMainWindow):
         self._append_log(f"Deleted save slot: {slot}")
         self._refresh_manage_saves_page()
 
+    def _schedule_career_refresh(self) -> None:
+        # Action handlers request a refresh; one rebuild runs per event-loop pass.
+        if self._career_refresh_pending:
+            return
+        self._career_refresh_pending = True
+        QTimer.singleShot(0, self._run_scheduled_career_refresh)
+
+    @Slot()
+    def _run_scheduled_career_refresh(self) -> None:
+        self._career_refresh_pending = False
+        # Showing the career page refreshes it, so skip work while it is hidden.
+        if self.career_page is None or self.stack.currentWidget() is not self.career_page:
+            return
+        self._refresh_career_view()
+
+    @Slot()
+    def _schedule_rankings_refresh(self, *_: object) -> None:
+        if self._rankings_refresh_pending:
+            return
+        self._rankings_refresh_pending = True
+        QTimer.singleShot(_SELECTION_DEBOUNCE_MS, self._run_scheduled_rankings_refresh)
+
+    @Slot()
+    def _run_scheduled_rankings_refresh(self) -> None:
+        self._rankings_refresh_pending = False
+        self._refresh_rankings_page()
+
+    @Slot()
     def _refresh_rankings_page(self, *_: object) -> None:
         if self.state is None:
             return
@@ -737,10 +1179,7 @@ class BoxingGameWindow(QMainWindow):
         if not self.state.pro_career.is_active:
             readiness = pro_readiness_status(self.state)
             self.rankings_subtitle.setText("Turn pro to unlock sanctioning-body rankings.")
-            self._rankings_rows = []
-            self.rankings_table.clear()
-            self.rankings_table.setRowCount(0)
-            self.rankings_table.setColumnCount(0)
+            self._rankings_model.clear()
             self.rankings_details_view.setPlainText(
                 (
                     "Not ranked yet.\n\n"
@@ -754,110 +1193,49 @@ class BoxingGameWindow(QMainWindow):
 
         ensure_rankings(self.state)
         org_name = self.rankings_org_combo.currentText().strip().upper()
-        self.rankings_table.clear()
-        self.rankings_table.setRowCount(0)
 
+        # One repaint for the model update and initial selection.
+        self.rankings_table.setUpdatesEnabled(False)
+        try:
+            entries = self._populate_rankings_table(self.state, org_name)
+        finally:
+            self.rankings_table.setUpdatesEnabled(True)
+        if not entries:
+            self.rankings_details_view.clear()
+
+    def _populate_rankings_table(self, state: CareerState, org_name: str) -> list[RankingsRow]:
+        boxer = state.boxer
         if org_name == "P4P":
-            entries = pound_for_pound_snapshot(self.state, top_n=20)
-            self._rankings_rows = entries
+            entries: list[RankingsRow] = list(pound_for_pound_snapshot(state, top_n=20))
             self.rankings_subtitle.setText(
                 f"Pound-for-pound top 20 | Active Division: {boxer.division}"
             )
-
-            headers = ["Rank", "Name", "Division", "Score", "OVR", "Record", "Lineal"]
-            self.rankings_table.setColumnCount(len(headers))
-            self.rankings_table.setHorizontalHeaderLabels(headers)
-            self.rankings_table.setRowCount(len(entries))
-
-            for row_idx, entry in enumerate(entries):
-                rank_label = f"#{entry.rank}"
-                name_label = f"{entry.name} (YOU)" if entry.is_player else entry.name
-                record_label = f"{entry.wins}-{entry.losses}-{entry.draws}"
-                lineal_label = "Yes" if entry.is_lineal_champion else ""
-                values = [
-                    rank_label,
-                    name_label,
-                    entry.division,
-                    f"{entry.score:.2f}",
-                    str(entry.rating),
-                    record_label,
-                    lineal_label,
-                ]
-                for col_idx, value in enumerate(values):
-                    self.rankings_table.setItem(row_idx, col_idx, QTableWidgetItem(value))
+            self._rankings_model.set_rows(entries, pound_for_pound=True)
         else:
-            entries = rankings_snapshot(self.state, org_name, top_n=20)
-            self._rankings_rows = entries
+            entries = list(rankings_snapshot(state, org_name, top_n=20))
             self.rankings_subtitle.setText(
                 (
                     f"Division: {boxer.division} | "
-                    f"Focus Organization: {self.state.pro_career.organization_focus} | "
+                    f"Focus Organization: {state.pro_career.organization_focus} | "
                     "Top 20"
                 )
             )
+            self._rankings_model.set_rows(entries, pound_for_pound=False)
 
-            headers = ["Rank", "Name", "OVR", "Record", "Age", "Stance", "Lineal"]
-            self.rankings_table.setColumnCount(len(headers))
-            self.rankings_table.setHorizontalHeaderLabels(headers)
-            self.rankings_table.setRowCount(len(entries))
-
-            for row_idx, entry in enumerate(entries):
-                rank_label = f"#{entry.rank}" if entry.rank > 0 else "NR"
-                name_label = f"{entry.name} (YOU)" if entry.is_player else entry.name
-                record_label = f"{entry.wins}-{entry.losses}-{entry.draws}"
-                lineal_label = "Yes" if entry.is_lineal_champion else ""
-                values = [
-                    rank_label,
-                    name_label,
-                    str(entry.rating),
-                    record_label,
-                    str(entry.age),
-                    entry.stance,
-                    lineal_label,
-                ]
-                for col_idx, value in enumerate(values):
-                    self.rankings_table.setItem(row_idx, col_idx, QTableWidgetItem(value))
-
-        self.rankings_table.resizeColumnsToContents()
-        if self._rankings_rows:
+        if entries:
             self.rankings_table.selectRow(0)
             self._on_ranking_row_selected()
-        else:
-            self.rankings_details_view.clear()
+        return entries
 
-    def _on_ranking_row_selected(self) -> None:
-        row_idx = self.rankings_table.currentRow()
-        if row_idx < 0 or row_idx >= len(self._rankings_rows):
+    @Slot()
+    def _on_ranking_row_selected(self, *_: object) -> None:
+        text = self._rankings_model.details(self.rankings_table.currentIndex().row())
+        if text is None:
             self.rankings_details_view.setPlainText("Select a boxer to view details.")
             return
+        self.rankings_details_view.setPlainText(text)
 
-        entry = self._rankings_rows[row_idx]
-        if isinstance(entry, PoundForPoundEntry):
-            lines = [
-                f"Name: {entry.name}",
-                f"P4P Rank: #{entry.rank}",
-                f"P4P Score: {entry.score:.2f}",
-                f"Division: {entry.division}",
-                f"Overall Rating: {entry.rating}",
-                f"Record: {entry.wins}-{entry.losses}-{entry.draws}",
-                f"Lineal Champion: {'Yes' if entry.is_lineal_champion else 'No'}",
-                f"Player Boxer: {'Yes' if entry.is_player else 'No'}",
-            ]
-        else:
-            rank_label = f"#{entry.rank}" if entry.rank > 0 else "NR"
-            lines = [
-                f"Name: {entry.name}",
-                f"Ranking: {rank_label}",
-                f"Division: {entry.division}",
-                f"Overall Rating: {entry.rating}",
-                f"Record: {entry.wins}-{entry.losses}-{entry.draws}",
-                f"Age: {entry.age}",
-                f"Stance: {entry.stance}",
-                f"Lineal Champion: {'Yes' if entry.is_lineal_champion else 'No'}",
-                f"Player Boxer: {'Yes' if entry.is_player else 'No'}",
-            ]
-        self.rankings_details_view.setPlainText("\n".join(lines))
-
+    @Slot()
     def _create_career(self) -> None:
         name = self.name_input.text().strip()
         stance = self.stance_input.currentText().strip().lower()
@@ -886,14 +1264,16 @@ class BoxingGameWindow(QMainWindow):
         state = CareerState(boxer=boxer)
         state.amateur_progress.tier = "novice"
         self._set_state(state)
-        self.event_log.clear()
+        self._clear_event_log()
         self._append_log(
             f"Career started for {boxer.profile.name} at age {boxer.profile.age} in {boxer.division}."
         )
 
+    @Slot()
     def _load_career(self) -> None:
+        # Scanned once; deletions below are applied to the in-memory list.
+        slots = list_saves()
         while True:
-            slots = list_saves()
             if not slots:
                 QMessageBox.information(self, "Load Career", "No saves found.")
                 return
@@ -902,7 +1282,7 @@ class BoxingGameWindow(QMainWindow):
                 self,
                 "Load Career",
                 "Choose save slot:",
-                slots,
+                tuple(slots),
                 0,
                 False,
             )
@@ -913,7 +1293,7 @@ class BoxingGameWindow(QMainWindow):
                 self,
                 "Save Action",
                 f"Choose action for '{slot}':",
-                ["Load", "Delete"],
+                _SAVE_ACTIONS,
                 0,
                 False,
             )
@@ -931,20 +1311,21 @@ class BoxingGameWindow(QMainWindow):
                     ensure_rankings(state)
 
                 self._set_state(state)
-                self.event_log.clear()
-                self._append_log(f"Loaded save slot: {slot}")
+                self._clear_event_log()
+                lines = [f"Loaded save slot: {slot}"]
                 if state.is_retired and state.retirement_reason:
-                    self._append_log(f"Retired career loaded: {state.retirement_reason}")
+                    lines.append(f"Retired career loaded: {state.retirement_reason}")
+                self._append_log_many(lines)
                 return
 
             confirm = QMessageBox.question(
                 self,
                 "Delete Save",
                 f"Delete save slot '{slot}'? This cannot be undone.",
-                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-                QMessageBox.StandardButton.No,
+                _YES_NO,
+                _NO,
             )
-            if confirm != QMessageBox.StandardButton.Yes:
+            if confirm != _YES:
                 continue
 
             try:
@@ -952,9 +1333,11 @@ class BoxingGameWindow(QMainWindow):
             except SavegameError as exc:
                 QMessageBox.critical(self, "Delete Failed", str(exc))
                 return
+            slots.remove(slot)
             QMessageBox.information(self, "Delete Save", f"Deleted save slot: {slot}")
             self._append_log(f"Deleted save slot: {slot}")
 
+    @Slot()
     def _save_career(self) -> None:
         if self.state is None:
             return
@@ -979,20 +1362,23 @@ class BoxingGameWindow(QMainWindow):
         self._append_log(f"Saved career to {path.name}")
         QMessageBox.information(self, "Save Career", f"Saved to {path}")
 
+    @Slot()
+    def _train_focus_clicked(self) -> None:
+        self._train_focus(self.sender().property("trainingFocus"))
+
     def _train_focus(self, focus: str) -> None:
         if self.state is None:
             return
         if self._guard_retired_action("Training"):
             return
 
-        focuses = {str(item) for item in load_rule_set("attribute_model")["training_focuses"]}
-        if focus not in focuses:
+        if focus not in training_focuses():
             QMessageBox.information(self, "Training", f"Unknown training focus: {focus}")
             return
 
         details = apply_standard_training(self.state, focus)
         self._advance_month(1)
-        self._refresh_career_view()
+        self._schedule_career_refresh()
         self._append_log(
             (
                 f"Training month complete. Focus: {focus} | "
@@ -1001,6 +1387,7 @@ class BoxingGameWindow(QMainWindow):
             )
         )
 
+    @Slot()
     def _special_training_camp(self) -> None:
         if self.state is None:
             return
@@ -1010,7 +1397,7 @@ class BoxingGameWindow(QMainWindow):
             QMessageBox.information(self, "Special Camp", "Special camp is available only after turning pro.")
             return
 
-        focuses = list(load_rule_set("attribute_model")["training_focuses"])
+        focuses = list(training_focuses())
         focus, ok = QInputDialog.getItem(
             self,
             "Special Camp",
@@ -1029,27 +1416,29 @@ class BoxingGameWindow(QMainWindow):
             return
 
         self._advance_month(months=int(details["months"]))
-        self._refresh_career_view()
+        self._schedule_career_refresh()
+        cost = _fmt_money(details["cost"])
         QMessageBox.information(
             self,
             "Special Camp Complete",
             (
                 f"Focus: {focus}\n"
-                f"Cost: ${details['cost']:,.2f}\n"
+                f"Cost: {cost}\n"
                 f"Coach Bonus: +{details['coach_bonus']}\n"
                 f"Fatigue: +{details['fatigue_gain']}\n"
                 f"Injury Risk: +{details['injury_risk_gain']}\n"
-                f"Balance: ${self.state.pro_career.purse_balance:,.2f}"
+                f"Balance: {_fmt_money(self.state.pro_career.purse_balance)}"
             ),
         )
         self._append_log(
             (
-                f"Special camp ({focus}) | cost ${details['cost']:,.2f} | "
+                f"Special camp ({focus}) | cost {cost} | "
                 f"coach +{details['coach_bonus']} | fatigue +{details['fatigue_gain']} | "
                 f"injury +{details['injury_risk_gain']}"
             )
         )
 
+    @Slot()
     def _medical_recovery(self) -> None:
         if self.state is None:
             return
@@ -1070,24 +1459,26 @@ class BoxingGameWindow(QMainWindow):
             return
 
         self._advance_month(months=int(details["months"]))
-        self._refresh_career_view()
+        self._schedule_career_refresh()
+        cost = _fmt_money(details["cost"])
         QMessageBox.information(
             self,
             "Medical Recovery Complete",
             (
-                f"Cost: ${details['cost']:,.2f}\n"
+                f"Cost: {cost}\n"
                 f"Fatigue Reduced: {details['fatigue_reduced']}\n"
                 f"Injury Risk Reduced: {details['injury_risk_reduced']}\n"
-                f"Balance: ${self.state.pro_career.purse_balance:,.2f}"
+                f"Balance: {_fmt_money(self.state.pro_career.purse_balance)}"
             ),
         )
         self._append_log(
             (
-                f"Medical recovery | cost ${details['cost']:,.2f} | "
+                f"Medical recovery | cost {cost} | "
                 f"fatigue -{details['fatigue_reduced']} | injury -{details['injury_risk_reduced']}"
             )
         )
 
+    @Slot()
     def _hire_staff_upgrade(self) -> None:
         if self.state is None:
             return
@@ -1107,26 +1498,25 @@ class BoxingGameWindow(QMainWindow):
             QMessageBox.information(self, "Staff Upgrades", "All staff upgrades are already at max level.")
             return
 
-        labels = [
+        options_by_label = {
             (
                 f"{item.label} L{item.level}/{item.max_level} "
-                f"-> L{item.level + 1} (${item.next_cost:,.2f})"
-            )
+                f"-> L{item.level + 1} ({_fmt_money(item.next_cost)})"
+            ): item
             for item in actionable
-        ]
+        }
         selected_label, ok = QInputDialog.getItem(
             self,
             "Staff Upgrades",
             "Choose staff upgrade:",
-            labels,
+            list(options_by_label),
             0,
             False,
         )
         if not ok or not selected_label:
             return
 
-        idx = labels.index(selected_label)
-        selected = actionable[idx]
+        selected = options_by_label[selected_label]
 
         try:
             result = purchase_staff_upgrade(self.state, selected.key)
@@ -1134,23 +1524,25 @@ class BoxingGameWindow(QMainWindow):
             QMessageBox.information(self, "Staff Upgrades", str(exc))
             return
 
-        self._refresh_career_view()
+        self._schedule_career_refresh()
+        cost = _fmt_money(result["cost"])
         QMessageBox.information(
             self,
             "Staff Upgraded",
             (
                 f"{result['label']} upgraded to L{result['new_level']}/{result['max_level']}\n"
-                f"Cost: ${result['cost']:,.2f}\n"
-                f"Balance: ${self.state.pro_career.purse_balance:,.2f}"
+                f"Cost: {cost}\n"
+                f"Balance: {_fmt_money(self.state.pro_career.purse_balance)}"
             ),
         )
         self._append_log(
             (
                 f"Staff upgrade: {result['label']} L{result['new_level']}/{result['max_level']} | "
-                f"cost ${result['cost']:,.2f}"
+                f"cost {cost}"
             )
         )
 
+    @Slot()
     def _rest_month(self) -> None:
         if self.state is None:
             return
@@ -1158,7 +1550,7 @@ class BoxingGameWindow(QMainWindow):
             return
         details = apply_rest_month(self.state)
         self._advance_month(1)
-        self._refresh_career_view()
+        self._schedule_career_refresh()
         self._append_log(
             (
                 "Rest month complete. "
@@ -1167,6 +1559,7 @@ class BoxingGameWindow(QMainWindow):
             )
         )
 
+    @Slot()
     def _take_amateur_fight(self) -> None:
         if self.state is None:
             return
@@ -1191,10 +1584,10 @@ class BoxingGameWindow(QMainWindow):
             self,
             "Amateur Fight Offer",
             prompt,
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-            QMessageBox.StandardButton.Yes,
+            _YES_NO,
+            _YES,
         )
-        if decision != QMessageBox.StandardButton.Yes:
+        if decision != _YES:
             self._append_log("Fight offer declined.")
             return
 
@@ -1212,7 +1605,7 @@ class BoxingGameWindow(QMainWindow):
             pro_record=self.state.pro_career.record,
         )
         self._advance_month(1)
-        self._refresh_career_view()
+        self._schedule_career_refresh()
 
         scorecard_lines = "\n".join(result.scorecards) if result.scorecards else "No scorecards (stoppage)."
         round_lines = "\n".join(result.round_log)
@@ -1233,6 +1626,7 @@ class BoxingGameWindow(QMainWindow):
             )
         )
 
+    @Slot()
     def _turn_pro(self) -> None:
         if self.state is None:
             return
@@ -1245,7 +1639,7 @@ class BoxingGameWindow(QMainWindow):
             QMessageBox.information(self, "Turn Pro", str(exc))
             return
 
-        self._refresh_career_view()
+        self._schedule_career_refresh()
         QMessageBox.information(
             self,
             "Turned Pro",
@@ -1262,6 +1656,7 @@ class BoxingGameWindow(QMainWindow):
             )
         )
 
+    @Slot()
     def _change_division(self) -> None:
         if self.state is None:
             return
@@ -1299,10 +1694,10 @@ class BoxingGameWindow(QMainWindow):
                 "Moving down includes major fatigue/injury penalties.\n"
                 "Any lineal championship in your current division is vacated immediately."
             ),
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-            QMessageBox.StandardButton.No,
+            _YES_NO,
+            _NO,
         )
-        if confirm != QMessageBox.StandardButton.Yes:
+        if confirm != _YES:
             return
 
         try:
@@ -1311,7 +1706,7 @@ class BoxingGameWindow(QMainWindow):
             QMessageBox.information(self, "Change Division", str(exc))
             return
 
-        self._refresh_career_view()
+        self._schedule_career_refresh()
         seeded_rank = result["seed_rank"]
         seeded_label = f"~#{seeded_rank}" if seeded_rank is not None else "Unranked"
         vacated = "Yes" if int(result["vacated_lineal"]) == 1 else "No"
@@ -1340,6 +1735,7 @@ class BoxingGameWindow(QMainWindow):
             )
         )
 
+    @Slot()
     def _take_pro_fight(self) -> None:
         if self.state is None:
             return
@@ -1358,18 +1754,13 @@ class BoxingGameWindow(QMainWindow):
             else "Unranked"
         )
         lineal_label = "Yes" if opponent.is_lineal_champion else "No"
-        opponent_body_ranks = []
-        for org_name, rank in opponent.organization_ranks.items():
-            if rank is None:
-                continue
-            opponent_body_ranks.append(f"{org_name} #{rank}")
-        body_rank_text = ", ".join(opponent_body_ranks) if opponent_body_ranks else "No listed body ranks"
-        sanctioned_bodies = purse.get("sanctioning_bodies", [])
-        sanctioned_text = (
-            ", ".join(str(item) for item in sanctioned_bodies)
-            if isinstance(sanctioned_bodies, list) and sanctioned_bodies
-            else "Focus body only"
-        )
+        body_rank_text = ", ".join(
+            f"{org_name} #{rank}"
+            for org_name, rank in opponent.organization_ranks.items()
+            if rank is not None
+        ) or "No listed body ranks"
+        # offer_purse always lists sanctioning bodies as strings.
+        sanctioned_text = ", ".join(purse.get("sanctioning_bodies", ())) or "Focus body only"
 
         prompt = (
             f"Opponent: {opponent.name}\n"
@@ -1379,7 +1770,7 @@ class BoxingGameWindow(QMainWindow):
             f"Record: {opponent.record.wins}-{opponent.record.losses}-{opponent.record.draws} (KO {opponent.record.kos})\n"
             f"Height/Weight: {opponent.height_ft}'{opponent.height_in}\" / {opponent.weight_lbs} lbs\n\n"
             f"Purse: {format_purse_breakdown(purse)}\n"
-            f"Total Expenses: ${purse['total_expenses']:,.2f}\n"
+            f"Total Expenses: {_fmt_money(purse['total_expenses'])}\n"
             f"Sanctioned Bodies: {sanctioned_text}\n"
             "Accept pro fight?"
         )
@@ -1388,10 +1779,10 @@ class BoxingGameWindow(QMainWindow):
             self,
             "Pro Fight Offer",
             prompt,
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-            QMessageBox.StandardButton.Yes,
+            _YES_NO,
+            _YES,
         )
-        if decision != QMessageBox.StandardButton.Yes:
+        if decision != _YES:
             self._append_log("Pro fight offer declined.")
             return
 
@@ -1409,10 +1800,11 @@ class BoxingGameWindow(QMainWindow):
             pro_record=self.state.pro_career.record,
         )
         self._advance_month(1)
-        self._refresh_career_view()
+        self._schedule_career_refresh()
 
         rank_label = f"#{new_rank}" if new_rank is not None else "Unranked"
         lineal_note = self.state.history[-1].notes if self.state.history else ""
+        net = _fmt_money(purse["net"])
         scorecard_lines = "\n".join(result.scorecards) if result.scorecards else "No scorecards (stoppage)."
         round_lines = "\n".join(result.round_log)
         outcome = (
@@ -1420,9 +1812,9 @@ class BoxingGameWindow(QMainWindow):
             f"Method: {result.method}\n"
             f"Rounds Completed: {result.rounds_completed}\n"
             f"{self.state.pro_career.organization_focus} Rank: {rank_label}\n"
-            f"Gross Purse: ${purse['gross']:,.2f}\n"
-            f"Total Expenses: ${purse['total_expenses']:,.2f}\n"
-            f"Net Purse Added: ${purse['net']:,.2f}\n\n"
+            f"Gross Purse: {_fmt_money(purse['gross'])}\n"
+            f"Total Expenses: {_fmt_money(purse['total_expenses'])}\n"
+            f"Net Purse Added: {net}\n\n"
             f"Sanctioned Bodies: {sanctioned_text}\n\n"
             f"Experience Gained: +{xp_gain} XP ({experience.title})\n\n"
             f"Lineal: {lineal_note or 'No lineal change'}\n\n"
@@ -1434,31 +1826,55 @@ class BoxingGameWindow(QMainWindow):
         self._append_log(
             (
                 f"Pro fight vs {opponent.name}: {result.method} ({result.winner}) | "
-                f"Net ${purse['net']:,.2f} | Rank {rank_label} | +{xp_gain} XP ({experience.title})"
+                f"Net {net} | Rank {rank_label} | +{xp_gain} XP ({experience.title})"
                 f" | Bodies {sanctioned_text}"
                 + (f" | {lineal_note}" if lineal_note else "")
             )
         )
 
+    def _staff_summary_lines(self, pc: ProCareer) -> list[str]:
+        # Staff levels only change on upgrades or loads, so reuse the indented
+        # lines while the level snapshot matches.
+        cached = self._staff_lines
+        if cached is not None and cached[0] == tuple(pc.staff_levels.items()):
+            return cached[1]
+        lines = ["  " + line for line in staff_summary_lines(self.state)]
+        # staff_summary_lines backfills missing keys, so snapshot afterwards.
+        self._staff_lines = (tuple(pc.staff_levels.items()), lines)
+        return lines
+
+    def _divisions_fought_label(self, pc: ProCareer) -> str:
+        # divisions_fought is only ever appended to, so the list and its
+        # length identify the joined label.
+        divisions = pc.divisions_fought
+        cached = self._divisions_label
+        if cached is not None and cached[0] is divisions and cached[1] == len(divisions):
+            return cached[2]
+        label = ", ".join(divisions) or "None"
+        self._divisions_label = (divisions, len(divisions), label)
+        return label
+
     def _refresh_career_view(self) -> None:
         if self.state is None:
             return
 
         boxer = self.state.boxer
-        is_pro = self.state.pro_career.is_active
+        division = boxer.division
+        pc = self.state.pro_career
+        is_pro = pc.is_active
         stage = "pro" if is_pro else "amateur"
         overall_rating = boxer_overall_rating(
             boxer,
             stage=stage,
-            pro_record=self.state.pro_career.record,
+            pro_record=pc.record,
         )
         experience = boxer_experience_profile(
             boxer,
-            pro_record=self.state.pro_career.record,
+            pro_record=pc.record,
         )
-        fights_total = total_career_fights(boxer, pro_record=self.state.pro_career.record)
+        fights_total = total_career_fights(boxer, pro_record=pc.record)
         amateur_record = boxer.record
-        pro_record = self.state.pro_career.record
+        pro_record = pc.record
 
         if is_pro:
             tier = pro_tier(self.state)
@@ -1487,11 +1903,11 @@ class BoxingGameWindow(QMainWindow):
         )
         if is_retired:
             self.career_summary.setText(
-                f"Division: {boxer.division} | Career Status: Retired | Final Active Record: {main_record}"
+                f"Division: {division} | Career Status: Retired | Final Active Record: {main_record}"
             )
         else:
             self.career_summary.setText(
-                f"Division: {boxer.division} | Tier: {tier_label} | Active Record: {main_record}"
+                f"Division: {division} | Tier: {tier_label} | Active Record: {main_record}"
             )
         if is_pro:
             p4p_rank, p4p_score = player_pound_for_pound_position(self.state)
@@ -1507,7 +1923,7 @@ class BoxingGameWindow(QMainWindow):
                     f"Popularity: {boxer.popularity} | Fatigue: {boxer.fatigue} | "
                     f"Injury: {boxer.injury_risk} | Experience: {experience.points} XP ({experience.title}) | "
                     f"P4P: {p4p_label} ({p4p_score:.2f}) | {lineal_label} | "
-                    f"Division Changes: {self.state.pro_career.division_changes}"
+                    f"Division Changes: {pc.division_changes}"
                 )
             )
             if is_retired:
@@ -1540,6 +1956,7 @@ class BoxingGameWindow(QMainWindow):
             else:
                 self.career_status.setText(amateur_status)
 
+        news = pc.last_world_news
         stats_lines = [
             f"Career Stage: {'Pro' if is_pro else 'Amateur'}",
             f"Age: {boxer.profile.age}",
@@ -1583,23 +2000,23 @@ class BoxingGameWindow(QMainWindow):
             ),
             "",
             (
-                f"Pro Balance: ${self.state.pro_career.purse_balance:,.2f} | "
-                f"Total Earnings: ${self.state.pro_career.total_earnings:,.2f}"
+                f"Pro Balance: {_fmt_money(pc.purse_balance)} | "
+                f"Total Earnings: {_fmt_money(pc.total_earnings)}"
             ),
             "Staff:",
         ]
-        for line in staff_summary_lines(self.state):
-            stats_lines.append(f"  {line}")
+        stats_lines.extend(self._staff_summary_lines(pc))
 
         stats_lines.extend([
-            f"Promoter: {self.state.pro_career.promoter or 'N/A'}",
-            f"Focus Org: {self.state.pro_career.organization_focus}",
+            f"Promoter: {pc.promoter or 'N/A'}",
+            f"Focus Org: {pc.organization_focus}",
             "Rankings:",
         ])
-        if self.state.pro_career.rankings:
-            for org_name, rank in self.state.pro_career.rankings.items():
-                rank_label = f"#{rank}" if rank is not None else "Unranked"
-                stats_lines.append(f"  {org_name}: {rank_label}")
+        if pc.rankings:
+            stats_lines.extend([
+                f"  {org_name}: #{rank}" if rank is not None else f"  {org_name}: Unranked"
+                for org_name, rank in pc.rankings.items()
+            ])
         else:
             stats_lines.append("  N/A")
 
@@ -1611,7 +2028,7 @@ class BoxingGameWindow(QMainWindow):
             lineal_division = player_lineal_division(self.state)
             lineal_defenses = 0
             if lineal_division is not None:
-                lineal_defenses = self.state.pro_career.lineal_defenses.get(lineal_division, 0)
+                lineal_defenses = pc.lineal_defenses.get(lineal_division, 0)
 
             stats_lines.extend([
                 f"P4P: {p4p_label} ({p4p_score:.2f})",
@@ -1621,62 +2038,60 @@ class BoxingGameWindow(QMainWindow):
                     if lineal_division is not None
                     else "Your Lineal Title: None"
                 ),
-                f"Divisions Fought: {', '.join(self.state.pro_career.divisions_fought) or 'None'}",
-                f"Division Changes: {self.state.pro_career.division_changes}",
+                f"Divisions Fought: {self._divisions_fought_label(pc)}",
+                f"Division Changes: {pc.division_changes}",
                 "",
                 "Organization Champions (Current Division):",
             ])
+            champion_lines = []
             for org_name in ORGANIZATION_NAMES:
-                champion = self.state.pro_career.organization_champions.get(org_name, {}).get(
-                    self.state.boxer.division
-                )
-                defenses = self.state.pro_career.organization_defenses.get(org_name, {}).get(
-                    self.state.boxer.division,
-                    0,
-                )
-                champion_label = champion or "Vacant"
-                stats_lines.append(f"  {org_name}: {champion_label} (D{defenses})")
+                champion = organization_division_champion(self.state, org_name, division)
+                defenses = organization_division_defenses(self.state, org_name, division)
+                champion_lines.append(f"  {org_name}: {champion or 'Vacant'} (D{defenses})")
+            stats_lines.extend(champion_lines)
 
-            if self.state.pro_career.last_world_news:
+            if news:
                 stats_lines.extend(["", "World News:"])
-                for item in self.state.pro_career.last_world_news[-6:]:
-                    stats_lines.append(f"  - {item}")
+                stats_lines.extend([f"  - {item}" for item in news[-6:]])
 
-        stats_lines.extend([
-            "",
-            "Stats:",
-        ])
-        for key, value in boxer.stats.to_dict().items():
-            stats_lines.append(f"  {key}: {value}")
-        self.stats_view.setPlainText("\n".join(stats_lines))
+        stats_lines.extend(("", "Stats:"))
+        stats_lines.extend([f"  {key}: {value}" for key, value in boxer.stats.to_dict().items()])
+        self._set_view_text(self.stats_view, "\n".join(stats_lines))
 
-        if self.state.pro_career.is_active:
-            news_lines = self.state.pro_career.last_world_news[-16:]
+        if is_pro:
+            news_lines = news[-16:]
             if news_lines:
-                self.world_news_view.setPlainText("\n".join(news_lines))
+                self._set_view_text(self.world_news_view, "\n".join(news_lines))
             else:
-                self.world_news_view.setPlainText("No world updates yet this month.")
+                self._set_view_text(self.world_news_view, "No world updates yet this month.")
         else:
-            self.world_news_view.setPlainText("World news unlocks after turning pro.")
-
-        if not self.state.history:
-            self.history_view.setPlainText("No fights yet.")
-            return
-
-        history_lines = []
-        for entry in self.state.history[-12:]:
-            purse_label = f" | purse ${entry.purse:,.2f}" if entry.stage == "pro" else ""
-            notes_label = f" | {entry.notes}" if entry.notes else ""
-            history_lines.append(
-                (
-                    f"[{entry.stage}] vs {entry.opponent_name} (rating {entry.opponent_rating}) | "
-                    f"{entry.result.method} | winner: {entry.result.winner}{purse_label}{notes_label}"
-                )
+            self._set_view_text(self.world_news_view, "World news unlocks after turning pro.")
+
+        history = self.state.history
+        if not history:
+            self._history_shown = None
+            self._set_view_text(self.history_view, "No fights yet.")
+            return
+
+        # History only grows, so append the entries added since the last
+        # refresh; a different or shorter list (new state) forces a reset.
+        shown = self._history_shown
+        if shown is not None and shown[0] is history and shown[1] <= len(history):
+            new_entries = history[shown[1]:]
+            if new_entries:
+                self._view_texts.pop(self.history_view, None)
+                self.history_view.appendPlainText("\n".join(map(_history_line, new_entries)))
+        else:
+            self._set_view_text(
+                self.history_view, "\n".join(map(_history_line, history[-_HISTORY_TAIL:]))
             )
-        self.history_view.setPlainText("\n".join(history_lines))
+        self._history_shown = (history, len(history))
 
 
 def run_gui() -> int:
+    # Application attributes must be set before the QApplication exists.
+    QApplication.setAttribute(Qt.ApplicationAttribute.AA_CompressHighFrequencyEvents, True)
+    QApplication.setAttribute(Qt.ApplicationAttribute.AA_DontCreateNativeWidgetSiblings, True)
     app = QApplication(sys.argv)
     window = BoxingGameWindow()
     window.show()
@@ -7,13 +7,14 @@ logic including legacy save migration.
 
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass, field
 from typing import Any
 
 from boxing_game.constants import STARTING_AGE
 
 
-@dataclass
+@dataclass(slots=True)
 class Stats:
     """The nine boxing attributes that define a fighter's style."""
     power: int
@@ -54,7 +55,7 @@ class Stats:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class CareerRecord:
     """Win/loss/draw/KO record for either amateur or pro career."""
     wins: int = 0
@@ -80,7 +81,7 @@ class CareerRecord:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class BoxerProfile:
     """Biographical and physical attributes of a boxer."""
     name: str
@@ -122,7 +123,7 @@ class BoxerProfile:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class AgingProfile:
     """Per-boxer aging curve parameters (peak, decline onset, severity)."""
     peak_age: int
@@ -157,7 +158,7 @@ class AgingProfile:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Boxer:
     """Complete mutable state for a player-controlled boxer."""
     profile: BoxerProfile
@@ -177,6 +178,10 @@ class Boxer:
             iq_growth_factor=1.0,
         )
     )
+    # Last (inputs, rating) pair computed by rating_engine; never persisted.
+    rating_cache: tuple[tuple, int] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -234,7 +239,7 @@ class Boxer:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Opponent:
     """Generated NPC opponent for a fight offer."""
     name: str
@@ -273,7 +278,7 @@ class Opponent:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class FightResult:
     """Outcome of a simulated fight (winner, method, scorecards)."""
     winner: str
@@ -302,7 +307,7 @@ class FightResult:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class FightHistoryEntry:
     """A single entry in the career fight history log."""
     opponent_name: str
@@ -380,7 +385,7 @@ class FightHistoryEntry:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class AmateurProgress:
     """Tracks the amateur career phase (fights, tier)."""
     fights_taken: int = 0
@@ -400,7 +405,7 @@ class AmateurProgress:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ProCareer:
     """Full pro-career state: rankings, titles, finances, and staff."""
     is_active: bool = False
@@ -540,7 +545,11 @@ class ProCareer:
         )
 
 
-@dataclass
+def _new_rng_seed() -> int:
+    return int.from_bytes(os.urandom(8), "big")
+
+
+@dataclass(slots=True)
 class CareerState:
     """Top-level game state container persisted across save/load cycles."""
     boxer: Boxer
@@ -553,6 +562,7 @@ class CareerState:
     is_retired: bool = False
     retirement_age: int | None = None
     retirement_reason: str = ""
+    rng_seed: int = field(default_factory=_new_rng_seed)
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -566,6 +576,7 @@ class CareerState:
             "is_retired": self.is_retired,
             "retirement_age": self.retirement_age,
             "retirement_reason": self.retirement_reason,
+            "rng_seed": self.rng_seed,
         }
 
     @classmethod
@@ -618,4 +629,9 @@ class CareerState:
                 else max(0, int(payload.get("retirement_age")))
             ),
             retirement_reason=str(payload.get("retirement_reason", "")),
+            rng_seed=(
+                _new_rng_seed()
+                if payload.get("rng_seed") is None
+                else int(payload["rng_seed"])
+            ),
         )
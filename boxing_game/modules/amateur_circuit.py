@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import random
 from dataclasses import dataclass
+from functools import lru_cache
 
 from boxing_game.constants import MAX_FATIGUE, MAX_INJURY_RISK, STARTING_AGE
 from boxing_game.models import (
@@ -22,7 +23,7 @@ from boxing_game.modules.attribute_engine import build_stats
 from boxing_game.modules.experience_engine import add_experience_points, fight_experience_gain
 from boxing_game.modules.fight_aftermath import calculate_post_fight_impact
 from boxing_game.modules.pro_spending import adjusted_fatigue_gain, adjusted_injury_risk_gain
-from boxing_game.modules.weight_class_engine import classify_weight
+from boxing_game.modules.weight_class_engine import WeightClass, classify_weight
 from boxing_game.rules_registry import load_rule_set
 from boxing_game.utils import clamp_stat
 
@@ -99,6 +100,43 @@ def current_tier(state: CareerState) -> dict:
 # Opponent generation
 # ---------------------------------------------------------------------------
 
+@dataclass(frozen=True)
+class OpponentTemplate:
+    """Fight-invariant opponent bounds for one tier and player weight."""
+
+    rating_min: int
+    rating_max: int
+    weight_class: WeightClass
+    min_weight: int
+    max_weight: int
+
+
+@lru_cache(maxsize=None)
+def opponent_template(
+    rating_min: int,
+    rating_max: int,
+    weight_lbs: int,
+    weight_spread: int,
+) -> OpponentTemplate:
+    """Resolve (and cache) the deterministic part of opponent generation.
+
+    Only the random draws remain per fight; the weight class and the
+    opponent weight window depend solely on the tier and player weight.
+    """
+    weight_class = classify_weight(weight_lbs)
+    min_weight = max(weight_class.min_lbs, weight_lbs - weight_spread)
+    max_weight = min(weight_class.max_lbs, weight_lbs + weight_spread)
+    if min_weight > max_weight:
+        min_weight, max_weight = weight_class.min_lbs, weight_class.max_lbs
+    return OpponentTemplate(
+        rating_min=rating_min,
+        rating_max=rating_max,
+        weight_class=weight_class,
+        min_weight=min_weight,
+        max_weight=max_weight,
+    )
+
+
 def generate_opponent(state: CareerState, rng: random.Random | None = None) -> Opponent:
     """Generate a randomised amateur opponent appropriate for the current tier.
 
@@ -110,21 +148,22 @@ def generate_opponent(state: CareerState, rng: random.Random | None = None) -> O
     randomizer = rng or random.Random()
     tier = current_tier(state)
     boxer = state.boxer
-    weight_class = classify_weight(boxer.profile.weight_lbs)
+    template = opponent_template(
+        int(tier["opponent_rating_min"]),
+        int(tier["opponent_rating_max"]),
+        boxer.profile.weight_lbs,
+        3,
+    )
+    weight_class = template.weight_class
 
-    rating = randomizer.randint(int(tier["opponent_rating_min"]), int(tier["opponent_rating_max"]))
+    rating = randomizer.randint(template.rating_min, template.rating_max)
     name = f"{randomizer.choice(FIRST_NAMES)} {randomizer.choice(LAST_NAMES)}"
 
     height_inches = max(56, min(84, randomizer.randint(weight_class.avg_height_in - 3, weight_class.avg_height_in + 3)))
     height_ft = height_inches // 12
     height_in = height_inches % 12
 
-    min_weight = max(weight_class.min_lbs, boxer.profile.weight_lbs - 3)
-    max_weight = min(weight_class.max_lbs, boxer.profile.weight_lbs + 3)
-    if min_weight > max_weight:
-        min_weight, max_weight = weight_class.min_lbs, weight_class.max_lbs
-
-    weight_lbs = randomizer.randint(min_weight, max_weight)
+    weight_lbs = randomizer.randint(template.min_weight, template.max_weight)
     base_stats = build_stats(height_inches=height_inches, weight_lbs=weight_lbs, weight_class=weight_class)
     shift = int(round((rating - _mean_stat(base_stats)) * 0.45))
     adjusted = {k: clamp_stat(v + shift) for k, v in base_stats.to_dict().items()}
@@ -6,12 +6,23 @@ training gains when a focus area is selected.
 
 from __future__ import annotations
 
+from dataclasses import fields, replace
+from functools import lru_cache
+
 from boxing_game.constants import MIN_STAT
 from boxing_game.models import Stats
 from boxing_game.modules.weight_class_engine import WeightClass
 from boxing_game.rules_registry import load_rule_set
 from boxing_game.utils import clamp_int
 
+_STAT_NAMES = frozenset(stat_field.name for stat_field in fields(Stats))
+
+
+@lru_cache(maxsize=1)
+def training_focuses() -> tuple[str, ...]:
+    """Training focus names from the attribute model, resolved once per process."""
+    return tuple(load_rule_set("attribute_model")["training_focuses"])
+
 
 def build_stats(
     *,
@@ -60,18 +71,17 @@ def training_gain(stats: Stats, focus: str) -> Stats:
     Training the *focus* stat by ``+2`` comes with small trade-offs in
     complementary stats (e.g. power training reduces speed by 1).
     """
-    fields = stats.to_dict()
-    if focus not in fields:
+    if focus not in _STAT_NAMES:
         raise ValueError(f"Unknown focus area: {focus}")
 
     rules = load_rule_set("attribute_model")
     max_stat = int(rules["stat_limits"]["max"])
 
-    fields[focus] = min(max_stat, fields[focus] + 2)
+    changes = {focus: min(max_stat, getattr(stats, focus) + 2)}
 
     if focus in ("power", "chin"):
-        fields["speed"] = max(MIN_STAT, fields["speed"] - 1)
+        changes["speed"] = max(MIN_STAT, stats.speed - 1)
     if focus in ("speed", "footwork"):
-        fields["power"] = max(MIN_STAT, fields["power"] - 1)
+        changes["power"] = max(MIN_STAT, stats.power - 1)
 
-    return Stats.from_dict(fields)
+    return replace(stats, **changes)
@@ -8,6 +8,7 @@ backfilled from total career fights.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 
 from boxing_game.models import Boxer, CareerRecord, FightResult, Opponent
 from boxing_game.rules_registry import load_rule_set
@@ -69,7 +70,13 @@ def _sorted_levels() -> list[dict[str, str | int]]:
 
 def profile_from_points(points: int) -> ExperienceProfile:
     """Resolve a raw XP value into a full ``ExperienceProfile``."""
-    safe_points = max(0, int(points))
+    return _profile_for_points(max(0, int(points)))
+
+
+@lru_cache(maxsize=1024)
+def _profile_for_points(safe_points: int) -> ExperienceProfile:
+    # Profiles are frozen and depend only on XP and the cached rule set, so
+    # career-view refreshes and fight setup share one instance per XP value.
     levels = _sorted_levels()
     if not levels:
         return ExperienceProfile(
@@ -75,8 +75,9 @@ def _score_round(
     randomizer: random.Random,
 ) -> None:
     """Update judge cards for one round based on *round_margin*."""
+    gauss = randomizer.gauss
     for card in judge_cards:
-        noisy_margin = round_margin + randomizer.gauss(0, judge_noise)
+        noisy_margin = round_margin + gauss(0, judge_noise)
         if noisy_margin > 1.0:
             card.boxer_points += 10
             card.opponent_points += 9
@@ -175,32 +176,37 @@ def _simulate_with_model(
     boxer_fatigue = float(boxer.fatigue)
     opponent_fatigue = 0.0
 
+    # Loop invariants: names, per-fight skill terms and the RNG method.
+    gauss = randomizer.gauss
+    boxer_name = boxer.profile.name
+    opponent_name = opponent.name
+    boxer_skill = (
+        boxer_base_skill + boxer_experience_bonus
+        - (boxer.injury_risk * injury_risk_penalty)
+    )
+    opponent_skill = opponent_base_skill + opponent_experience_bonus
+    boxer_power_term = (boxer.stats.power - opponent.stats.chin) * 0.002
+    opp_power_term = (opponent.stats.power - boxer.stats.chin) * 0.002
+    boxer_notes = f"{boxer_name} controls distance"
+    opponent_notes = f"{opponent_name} wins exchanges inside"
+
     for round_number in range(1, scheduled_rounds + 1):
-        boxer_form = (
-            boxer_base_skill + boxer_experience_bonus
-            - (boxer_fatigue * fatigue_penalty)
-            - (boxer.injury_risk * injury_risk_penalty)
-        )
-        opponent_form = (
-            opponent_base_skill + opponent_experience_bonus
-            - (opponent_fatigue * fatigue_penalty)
-        )
+        boxer_form = boxer_skill - (boxer_fatigue * fatigue_penalty)
+        opponent_form = opponent_skill - (opponent_fatigue * fatigue_penalty)
 
-        boxer_swing = randomizer.gauss(0, swing_factor)
-        opponent_swing = randomizer.gauss(0, swing_factor)
+        boxer_swing = gauss(0, swing_factor)
+        opponent_swing = gauss(0, swing_factor)
         round_margin = (boxer_form + boxer_swing) - (opponent_form + opponent_swing)
 
         # KO / stoppage chances
-        power_edge = boxer.stats.power - opponent.stats.chin
-        opp_power_edge = opponent.stats.power - boxer.stats.chin
         ko_pressure = max(0.0, (abs(round_margin) - 6.0) * 0.012)
 
-        boxer_ko_chance = min(max_ko_chance, max(0.0, base_ko_chance + ko_pressure + (power_edge * 0.002)))
-        opp_ko_chance = min(max_ko_chance, max(0.0, base_ko_chance + ko_pressure + (opp_power_edge * 0.002)))
+        boxer_ko_chance = min(max_ko_chance, max(0.0, base_ko_chance + ko_pressure + boxer_power_term))
+        opp_ko_chance = min(max_ko_chance, max(0.0, base_ko_chance + ko_pressure + opp_power_term))
 
         stoppage = _check_stoppage(
             round_margin, boxer_ko_chance, opp_ko_chance, randomizer,
-            boxer_name=boxer.profile.name, opponent_name=opponent.name,
+            boxer_name=boxer_name, opponent_name=opponent_name,
             round_number=round_number, round_log=round_log,
             threshold=stoppage_threshold,
         )
@@ -209,11 +215,11 @@ def _simulate_with_model(
 
         # Round narration
         if round_margin > 1.2:
-            round_winner = boxer.profile.name
-            notes = f"{boxer.profile.name} controls distance"
+            round_winner = boxer_name
+            notes = boxer_notes
         elif round_margin < -1.2:
-            round_winner = opponent.name
-            notes = f"{opponent.name} wins exchanges inside"
+            round_winner = opponent_name
+            notes = opponent_notes
         else:
             round_winner = "even"
             notes = "close tactical round"
@@ -226,7 +232,7 @@ def _simulate_with_model(
 
     # Decision
     decision = _decision_from_cards(
-        judge_cards, boxer.profile.name, opponent.name, scheduled_rounds,
+        judge_cards, boxer_name, opponent_name, scheduled_rounds,
     )
     return FightResult(
         winner=decision.winner,
@@ -20,13 +20,19 @@ from boxing_game.models import (
     ProCareer,
     Stats,
 )
-from boxing_game.modules.amateur_circuit import FIRST_NAMES, LAST_NAMES, STANCE_CHOICES, pro_ready
+from boxing_game.modules.amateur_circuit import (
+    FIRST_NAMES,
+    LAST_NAMES,
+    STANCE_CHOICES,
+    opponent_template,
+    pro_ready,
+)
 from boxing_game.modules.attribute_engine import build_stats
 from boxing_game.modules.experience_engine import add_experience_points, fight_experience_gain
 from boxing_game.modules.fight_aftermath import calculate_post_fight_impact
 from boxing_game.modules.pro_spending import adjusted_fatigue_gain, adjusted_injury_risk_gain
 from boxing_game.modules.rating_engine import boxer_overall_rating
-from boxing_game.modules.weight_class_engine import WeightClass, classify_weight, list_weight_classes
+from boxing_game.modules.weight_class_engine import WeightClass, list_weight_classes
 from boxing_game.rules_registry import load_rule_set
 from boxing_game.utils import clamp_probability, clamp_stat
 
@@ -263,12 +269,29 @@ def organization_division_champion(
     organization: str,
     division: str | None = None,
 ) -> str | None:
+    """Return *organization*'s champion in *division* (default: the boxer's)."""
     if not state.pro_career.is_active:
         return None
     ensure_organization_titles(state)
     org_name = organization.strip().upper()
     target_division = (division or state.boxer.division).strip().lower()
-    return state.pro_career.organization_champions.get(org_name, {}).get(target_division)
+    org_champions = state.pro_career.organization_champions.get(org_name)
+    return org_champions.get(target_division) if org_champions else None
+
+
+def organization_division_defenses(
+    state: CareerState,
+    organization: str,
+    division: str | None = None,
+) -> int:
+    """Return *organization*'s title defenses in *division* (default: the boxer's)."""
+    if not state.pro_career.is_active:
+        return 0
+    ensure_organization_titles(state)
+    org_name = organization.strip().upper()
+    target_division = (division or state.boxer.division).strip().lower()
+    org_defenses = state.pro_career.organization_defenses.get(org_name)
+    return int(org_defenses.get(target_division, 0)) if org_defenses else 0
 
 
 def player_lineal_division(state: CareerState) -> str | None:
@@ -1073,12 +1096,18 @@ def generate_pro_opponent(state: CareerState, rng: random.Random | None = None)
     tier = pro_tier(state)
     boxer = state.boxer
     focus_org = state.pro_career.organization_focus
-    weight_class = classify_weight(boxer.profile.weight_lbs)
+    template = opponent_template(
+        int(tier["opponent_rating_min"]),
+        int(tier["opponent_rating_max"]),
+        boxer.profile.weight_lbs,
+        5,
+    )
+    weight_class = template.weight_class
 
     ranked_entry = _pick_ranked_opponent_entry(state, randomizer)
 
-    rating_floor = int(tier["opponent_rating_min"])
-    rating_ceiling = int(tier["opponent_rating_max"])
+    rating_floor = template.rating_min
+    rating_ceiling = template.rating_max
     if ranked_entry is not None:
         rating = max(rating_floor, min(98, ranked_entry.rating + randomizer.randint(-1, 1)))
         name = ranked_entry.name
@@ -1106,12 +1135,7 @@ def generate_pro_opponent(state: CareerState, rng: random.Random | None = None)
     height_ft = height_inches // 12
     height_in = height_inches % 12
 
-    min_weight = max(weight_class.min_lbs, boxer.profile.weight_lbs - 5)
-    max_weight = min(weight_class.max_lbs, boxer.profile.weight_lbs + 5)
-    if min_weight > max_weight:
-        min_weight, max_weight = weight_class.min_lbs, weight_class.max_lbs
-
-    weight_lbs = randomizer.randint(min_weight, max_weight)
+    weight_lbs = randomizer.randint(template.min_weight, template.max_weight)
     base_stats = build_stats(
         height_inches=height_inches,
         weight_lbs=weight_lbs,
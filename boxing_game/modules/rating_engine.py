@@ -2,15 +2,24 @@
 
 Computes a single ``int`` rating (20-99) for a boxer by combining
 weighted fight-model stats, experience bonus, and fatigue penalty.
+The last result is memoised on the boxer, keyed by every input.
 """
 
 from __future__ import annotations
 
+from dataclasses import fields
+from operator import attrgetter
+
 from boxing_game.models import Boxer, CareerRecord, Stats
-from boxing_game.modules.experience_engine import boxer_experience_profile
+from boxing_game.modules.experience_engine import (
+    boxer_experience_profile,
+    total_career_fights,
+)
 from boxing_game.rules_registry import load_rule_set
 from boxing_game.utils import clamp_int
 
+_stat_values = attrgetter(*(stat_field.name for stat_field in fields(Stats)))
+
 
 def _weighted_rating(stats: Stats, model_key: str) -> int:
     """Compute the weighted rating for *stats* using the given fight model."""
@@ -45,6 +54,23 @@ def boxer_overall_rating(
     subtracts a fatigue penalty.
     """
     model_key = "pro" if stage == "pro" else "amateur"
+    # Fight totals only influence XP when no points have been recorded.
+    fights = (
+        total_career_fights(boxer, pro_record=pro_record)
+        if boxer.experience_points <= 0
+        else None
+    )
+    key = (
+        model_key,
+        _stat_values(boxer.stats),
+        boxer.experience_points,
+        fights,
+        boxer.fatigue,
+    )
+    cached = boxer.rating_cache
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
     base = _weighted_rating(boxer.stats, model_key)
     experience_bonus = boxer_experience_profile(
         boxer,
@@ -52,4 +78,6 @@ def boxer_overall_rating(
     ).fight_bonus
     fatigue_penalty = int(round(boxer.fatigue * 0.5))
     adjusted = int(round(base + experience_bonus)) - fatigue_penalty
-    return clamp_int(adjusted, 20, 99)
+    rating = clamp_int(adjusted, 20, 99)
+    boxer.rating_cache = (key, rating)
+    return rating
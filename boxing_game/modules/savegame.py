@@ -1,15 +1,20 @@
-"""Save/load/delete career state as JSON.
+"""Save/load/delete career state as gzip-compressed JSON.
 
-Supports atomic writes, slot management (rename/duplicate/delete),
-and metadata listing for the GUI save-management page.
+Saves are written to ``<slot>.json.gz``.  Supports atomic writes, slot
+management (rename/duplicate/delete), and metadata listing for the GUI
+save-management page.  Uncompressed ``<slot>.json`` saves from older
+versions are still listed and loaded; re-saving such a slot replaces it
+with the compressed file.
 """
 
 from __future__ import annotations
 
+import gzip
 import json
 import os
 import re
 import shutil
+import zlib
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
@@ -24,6 +29,16 @@ DEFAULT_SAVE_DIR = PROJECT_ROOT / "saves"
 
 _SLOT_PATTERN = re.compile(r"^[a-zA-Z0-9_-]{1,40}$")
 
+# Compact separators keep save payloads small; files stay valid JSON.
+_JSON_SEPARATORS = (",", ":")
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_GZIP_LEVEL = 1
+
+_SAVE_SUFFIX = ".json.gz"
+# Plain-JSON saves written before compression; read but never created.
+_LEGACY_SUFFIX = ".json"
+
 
 class SavegameError(ValueError):
     """Raised when save files are invalid or missing."""
@@ -60,38 +75,89 @@ def _validate_slot(slot: str) -> str:
     return candidate
 
 
-def _save_path(slot: str, save_dir: Path | None = None) -> Path:
+def _save_base(save_dir: Path | None = None) -> Path:
     base = save_dir or DEFAULT_SAVE_DIR
     base.mkdir(parents=True, exist_ok=True)
-    return base / f"{slot}.json"
+    return base
+
+
+def _save_path(slot: str, save_dir: Path | None = None) -> Path:
+    return _save_base(save_dir) / f"{slot}{_SAVE_SUFFIX}"
+
+
+def _existing_save_path(slot: str, save_dir: Path | None = None) -> Path | None:
+    """Return the file holding *slot*, preferring the compressed format."""
+    base = _save_base(save_dir)
+    for suffix in (_SAVE_SUFFIX, _LEGACY_SUFFIX):
+        path = base / f"{slot}{suffix}"
+        if path.exists():
+            return path
+    return None
+
+
+def _slot_from_path(path: Path) -> str | None:
+    for suffix in (_SAVE_SUFFIX, _LEGACY_SUFFIX):
+        if path.name.endswith(suffix):
+            slot = path.name[: -len(suffix)]
+            return slot if _SLOT_PATTERN.match(slot) else None
+    return None
+
+
+def _slot_files(base: Path) -> dict[str, Path]:
+    """Map slot name to save file; a compressed file wins over a legacy one."""
+    files: dict[str, Path] = {}
+    for suffix in (_LEGACY_SUFFIX, _SAVE_SUFFIX):
+        for path in base.glob(f"*{suffix}"):
+            slot = _slot_from_path(path)
+            if slot is not None and path.is_file():
+                files[slot] = path
+    return files
 
 
 # ---------------------------------------------------------------------------
 # Core I/O
 # ---------------------------------------------------------------------------
 
+def _read_payload(path: Path) -> object:
+    """Decode a save file, decompressing it first if it is gzip-encoded."""
+    raw = path.read_bytes()
+    if raw[:2] == _GZIP_MAGIC:
+        raw = gzip.decompress(raw)
+    return json.loads(raw)
+
+
 def save_state(state: CareerState, slot: str, save_dir: Path | None = None) -> Path:
     """Persist *state* to the given save slot atomically."""
     normalized_slot = _validate_slot(slot)
     target_path = _save_path(normalized_slot, save_dir=save_dir)
 
-    payload = {
-        "version": CURRENT_SAVE_VERSION,
-        "saved_at": datetime.now(timezone.utc).isoformat(),
-        "career": state.to_dict(),
-    }
+    payload = json.dumps(
+        {
+            "version": CURRENT_SAVE_VERSION,
+            "saved_at": datetime.now(timezone.utc).isoformat(),
+            "career": state.to_dict(),
+        },
+        separators=_JSON_SEPARATORS,
+    )
+    # Encode fully in memory so the temp file receives a single write.
+    data = gzip.compress(
+        payload.encode("utf-8"),
+        compresslevel=_GZIP_LEVEL,
+        mtime=0,
+    )
     temp_path: Path | None = None
     try:
         with NamedTemporaryFile(
-            "w", encoding="utf-8",
+            "wb",
             dir=target_path.parent, prefix=f"{normalized_slot}.", suffix=".tmp",
             delete=False,
         ) as handle:
             temp_path = Path(handle.name)
-            json.dump(payload, handle, indent=2)
+            handle.write(data)
             handle.flush()
             os.fsync(handle.fileno())
         temp_path.replace(target_path)
+        target_path.with_name(f"{normalized_slot}{_LEGACY_SUFFIX}").unlink(missing_ok=True)
     except OSError as exc:
         raise SavegameError(f"Failed to write save file: {exc}") from exc
     finally:
@@ -103,15 +169,16 @@ def save_state(state: CareerState, slot: str, save_dir: Path | None = None) -> P
 def load_state(slot: str, save_dir: Path | None = None) -> CareerState:
     """Load and validate a career state from the given save slot."""
     normalized_slot = _validate_slot(slot)
-    source_path = _save_path(normalized_slot, save_dir=save_dir)
-    if not source_path.exists():
+    source_path = _existing_save_path(normalized_slot, save_dir=save_dir)
+    if source_path is None:
         raise SavegameError(f"Save slot not found: {normalized_slot}")
 
     try:
-        with source_path.open("r", encoding="utf-8") as handle:
-            payload = json.load(handle)
-    except json.JSONDecodeError as exc:
+        payload = _read_payload(source_path)
+    except (json.JSONDecodeError, UnicodeDecodeError) as exc:
         raise SavegameError("Save file is not valid JSON.") from exc
+    except (EOFError, zlib.error, gzip.BadGzipFile) as exc:
+        raise SavegameError("Save file is corrupt.") from exc
     except OSError as exc:
         raise SavegameError(f"Failed to read save file: {exc}") from exc
 
@@ -149,12 +216,13 @@ def rename_state(slot: str, new_slot: str, save_dir: Path | None = None) -> Path
     if source_slot == target_slot:
         raise SavegameError("Source and destination save slots must be different.")
 
-    source_path = _save_path(source_slot, save_dir=save_dir)
-    target_path = _save_path(target_slot, save_dir=save_dir)
-    if not source_path.exists():
+    source_path = _existing_save_path(source_slot, save_dir=save_dir)
+    if source_path is None:
         raise SavegameError(f"Save slot not found: {source_slot}")
-    if target_path.exists():
+    if _existing_save_path(target_slot, save_dir=save_dir) is not None:
         raise SavegameError(f"Save slot already exists: {target_slot}")
+    # Keep the source's format: a legacy plain-JSON file stays ``.json``.
+    target_path = source_path.with_name(target_slot + source_path.name[len(source_slot):])
 
     try:
         source_path.replace(target_path)
@@ -170,12 +238,12 @@ def duplicate_state(slot: str, new_slot: str, save_dir: Path | None = None) -> P
     if source_slot == target_slot:
         raise SavegameError("Source and destination save slots must be different.")
 
-    source_path = _save_path(source_slot, save_dir=save_dir)
-    target_path = _save_path(target_slot, save_dir=save_dir)
-    if not source_path.exists():
+    source_path = _existing_save_path(source_slot, save_dir=save_dir)
+    if source_path is None:
         raise SavegameError(f"Save slot not found: {source_slot}")
-    if target_path.exists():
+    if _existing_save_path(target_slot, save_dir=save_dir) is not None:
         raise SavegameError(f"Save slot already exists: {target_slot}")
+    target_path = source_path.with_name(target_slot + source_path.name[len(source_slot):])
 
     try:
         shutil.copy2(source_path, target_path)
@@ -187,12 +255,14 @@ def duplicate_state(slot: str, new_slot: str, save_dir: Path | None = None) -> P
 def delete_state(slot: str, save_dir: Path | None = None) -> Path:
     """Delete a save slot file."""
     normalized_slot = _validate_slot(slot)
-    target_path = _save_path(normalized_slot, save_dir=save_dir)
-    if not target_path.exists():
+    target_path = _existing_save_path(normalized_slot, save_dir=save_dir)
+    if target_path is None:
         raise SavegameError(f"Save slot not found: {normalized_slot}")
 
     try:
         target_path.unlink()
+        # A stale legacy file would otherwise resurface under the same slot.
+        target_path.with_name(f"{normalized_slot}{_LEGACY_SUFFIX}").unlink(missing_ok=True)
     except OSError as exc:
         raise SavegameError(f"Failed to delete save file: {exc}") from exc
     return target_path
@@ -205,10 +275,11 @@ def delete_state(slot: str, save_dir: Path | None = None) -> Path:
 def _read_save_metadata(slot: str, path: Path) -> SaveMetadata:
     """Read lightweight metadata from a save file without full state load."""
     try:
-        with path.open("r", encoding="utf-8") as handle:
-            payload = json.load(handle)
-    except json.JSONDecodeError:
+        payload = _read_payload(path)
+    except (json.JSONDecodeError, UnicodeDecodeError):
         return _invalid_metadata(slot, path, "Invalid JSON")
+    except (EOFError, zlib.error, gzip.BadGzipFile):
+        return _invalid_metadata(slot, path, "Corrupt save file")
     except OSError as exc:
         return _invalid_metadata(slot, path, f"Unreadable: {exc}")
 
@@ -281,11 +352,7 @@ def list_save_metadata(save_dir: Path | None = None) -> list[SaveMetadata]:
     if not base.exists():
         return []
 
-    items: list[SaveMetadata] = []
-    for path in base.glob("*.json"):
-        if not path.is_file() or not _SLOT_PATTERN.match(path.stem):
-            continue
-        items.append(_read_save_metadata(path.stem, path))
+    items = [_read_save_metadata(slot, path) for slot, path in _slot_files(base).items()]
 
     items.sort(
         key=lambda item: (_saved_at_sort_value(item.saved_at), item.slot),
@@ -300,8 +367,4 @@ def list_saves(save_dir: Path | None = None) -> list[str]:
     if not base.exists():
         return []
 
-    slots: list[str] = []
-    for path in base.glob("*.json"):
-        if path.is_file() and _SLOT_PATTERN.match(path.stem):
-            slots.append(path.stem)
-    return sorted(slots)
+    return sorted(_slot_files(base))
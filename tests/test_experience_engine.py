@@ -31,6 +31,12 @@ def test_profile_from_points_advances_levels() -> None:
     assert veteran.fight_bonus > rookie.fight_bonus
 
 
+def test_profile_from_points_clamps_negative_points_and_reuses_profiles() -> None:
+    assert profile_from_points(-5) is profile_from_points(0)
+    assert profile_from_points(200) is profile_from_points(200)
+    assert profile_from_points(-5).points == 0
+
+
 def test_fight_experience_gain_varies_by_stage_and_result() -> None:
     boxer_name = "XP Boxer"
     pro_win = fight_experience_gain(
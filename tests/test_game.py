@@ -0,0 +1,69 @@
+import random
+from pathlib import Path
+
+import pytest
+
+from boxing_game import game
+from boxing_game.models import CareerState
+from boxing_game.modules import savegame
+from boxing_game.modules.amateur_circuit import generate_opponent
+from boxing_game.modules.fight_sim_engine import simulate_amateur_fight
+from boxing_game.modules.player_profile import create_boxer
+from boxing_game.modules.savegame import load_state
+
+
+def _next_fight(state: CareerState, rng: random.Random) -> tuple:
+    opponent = generate_opponent(state, rng=rng)
+    result = simulate_amateur_fight(state.boxer, opponent, rng=rng)
+    return opponent.name, opponent.rating, result.winner, result.method, result.round_log
+
+
+def test_saved_career_replays_next_fight_after_non_fight_actions(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(savegame, "DEFAULT_SAVE_DIR", tmp_path)
+    monkeypatch.setattr(game, "_read_line", lambda prompt: "replay_slot")
+    boxer = create_boxer(
+        name="Replay",
+        stance="orthodox",
+        height_ft=5,
+        height_in=10,
+        weight_lbs=150,
+    )
+    state = CareerState(boxer=boxer)
+    rng = random.Random(state.rng_seed)
+
+    game._rest(state, rng)
+    game._rest(state, rng)
+    game._save_career(state, rng)
+
+    loaded = load_state("replay_slot", save_dir=tmp_path)
+    assert loaded.rng_seed == state.rng_seed
+    assert _next_fight(loaded, random.Random(loaded.rng_seed)) == _next_fight(state, rng)
+
+
+def test_save_career_reports_bad_slot_before_returning(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    monkeypatch.setattr(savegame, "DEFAULT_SAVE_DIR", tmp_path)
+    monkeypatch.setattr(game, "_read_line", lambda prompt: "bad slot!")
+    boxer = create_boxer(
+        name="Slotty",
+        stance="southpaw",
+        height_ft=5,
+        height_in=9,
+        weight_lbs=140,
+    )
+    state = CareerState(boxer=boxer)
+
+    game._save_career(state, random.Random(1))
+
+    assert "Save failed:" in capsys.readouterr().out
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_menu_additions_keep_existing_option_numbers() -> None:
+    assert game._PRO_ACTIONS[9] is game._save_career
+    assert game._PRO_ACTIONS[10] is None
+    assert game._AMATEUR_ACTIONS[6] is game._save_career
+    assert game._AMATEUR_ACTIONS[7] is None
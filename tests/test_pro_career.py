@@ -15,6 +15,8 @@ from boxing_game.modules.pro_career import (
     ensure_rankings,
     generate_pro_opponent,
     offer_purse,
+    organization_division_champion,
+    organization_division_defenses,
     player_lineal_division,
     pound_for_pound_snapshot,
     rankings_snapshot,
@@ -225,6 +227,22 @@ def test_ensure_rankings_backfills_missing_organizations() -> None:
         assert org_name in state.pro_career.rankings
 
 
+def test_organization_division_title_lookups_tolerate_unknown_orgs() -> None:
+    state = _build_pro_ready_state()
+    assert organization_division_defenses(state, "WBC") == 0
+    turn_pro(state, rng=random.Random(5))
+
+    division = state.boxer.division
+    state.pro_career.organization_defenses["WBC"][division] = 3
+
+    assert organization_division_champion(state, "wbc") == (
+        state.pro_career.organization_champions["WBC"][division]
+    )
+    assert organization_division_defenses(state, " wbc ") == 3
+    assert organization_division_champion(state, "NOPE") is None
+    assert organization_division_defenses(state, "NOPE") == 0
+
+
 def test_purse_breakdown_has_total_expenses() -> None:
     rng = random.Random(17)
     state = _build_pro_ready_state()
@@ -248,6 +266,21 @@ def test_boxer_overall_rating_stays_in_bounds() -> None:
     assert 20 <= rating <= 99
 
 
+def test_boxer_overall_rating_tracks_stat_and_fatigue_changes() -> None:
+    state = _build_pro_ready_state()
+    boxer = state.boxer
+    before = boxer_overall_rating(boxer, stage="pro")
+    assert boxer_overall_rating(boxer, stage="pro") == before
+
+    boxer.stats.power = 99
+    boxer.stats.speed = 99
+    boosted = boxer_overall_rating(boxer, stage="pro")
+    assert boosted > before
+
+    boxer.fatigue = 12
+    assert boxer_overall_rating(boxer, stage="pro") < boosted
+
+
 def test_rankings_snapshot_requires_pro_state() -> None:
     boxer = create_boxer(
         name="No Pro",
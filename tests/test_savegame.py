@@ -1,10 +1,13 @@
+import gzip
 import json
+from datetime import datetime, timezone
 from pathlib import Path
 
 import pytest
 
 from boxing_game.constants import STARTING_AGE
 from boxing_game.models import CareerRecord, CareerState
+from boxing_game.modules import savegame
 from boxing_game.modules.experience_engine import infer_points_from_total_fights
 from boxing_game.modules.player_profile import create_boxer
 from boxing_game.modules.savegame import (
@@ -33,6 +36,7 @@ def test_save_and_load_round_trip(tmp_path: Path) -> None:
     state.is_retired = True
     state.retirement_age = 34
     state.retirement_reason = "Test retirement reason."
+    state.rng_seed = 2**63 + 12345
 
     save_state(state, "slot_one", save_dir=tmp_path)
     loaded = load_state("slot_one", save_dir=tmp_path)
@@ -43,6 +47,7 @@ def test_save_and_load_round_trip(tmp_path: Path) -> None:
     assert loaded.is_retired is True
     assert loaded.retirement_age == 34
     assert loaded.retirement_reason == "Test retirement reason."
+    assert loaded.rng_seed == 2**63 + 12345
     assert list_saves(save_dir=tmp_path) == ["slot_one"]
 
 
@@ -70,7 +75,7 @@ def test_delete_state_removes_slot(tmp_path: Path) -> None:
 
     deleted_path = delete_state("trash_slot", save_dir=tmp_path)
 
-    assert deleted_path.name == "trash_slot.json"
+    assert deleted_path.name == "trash_slot.json.gz"
     assert list_saves(save_dir=tmp_path) == []
 
 
@@ -92,7 +97,7 @@ def test_rename_state_moves_slot(tmp_path: Path) -> None:
 
     renamed_path = rename_state("old_slot", "new_slot", save_dir=tmp_path)
 
-    assert renamed_path.name == "new_slot.json"
+    assert renamed_path.name == "new_slot.json.gz"
     assert list_saves(save_dir=tmp_path) == ["new_slot"]
 
 
@@ -109,7 +114,7 @@ def test_duplicate_state_creates_second_slot(tmp_path: Path) -> None:
 
     duplicate_path = duplicate_state("source_slot", "target_slot", save_dir=tmp_path)
 
-    assert duplicate_path.name == "target_slot.json"
+    assert duplicate_path.name == "target_slot.json.gz"
     assert list_saves(save_dir=tmp_path) == ["source_slot", "target_slot"]
     loaded = load_state("target_slot", save_dir=tmp_path)
     assert loaded.boxer.profile.name == "Copy Me"
@@ -201,3 +206,90 @@ def test_load_rejects_invalid_career_payload(tmp_path: Path) -> None:
 
     with pytest.raises(SavegameError, match="career payload is invalid"):
         load_state("bad_career_slot", save_dir=tmp_path)
+
+
+def test_save_writes_gzip_and_loads_plain_json(tmp_path: Path) -> None:
+    boxer = create_boxer(
+        name="Packer",
+        stance="orthodox",
+        height_ft=5,
+        height_in=10,
+        weight_lbs=147,
+    )
+    path = save_state(CareerState(boxer=boxer), "packed_slot", save_dir=tmp_path)
+
+    raw = path.read_bytes()
+    assert raw[:2] == b"\x1f\x8b"
+    payload = json.loads(gzip.decompress(raw))
+    assert payload["career"]["boxer"]["profile"]["name"] == "Packer"
+
+    plain_path = tmp_path / "plain_slot.json"
+    plain_path.write_text(json.dumps(payload), encoding="utf-8")
+    assert load_state("plain_slot", save_dir=tmp_path).boxer.profile.name == "Packer"
+
+
+def test_load_rejects_truncated_gzip(tmp_path: Path) -> None:
+    path = tmp_path / "truncated_slot.json"
+    path.write_bytes(gzip.compress(b'{"version": 2}')[:12])
+
+    with pytest.raises(SavegameError, match="corrupt"):
+        load_state("truncated_slot", save_dir=tmp_path)
+
+
+def test_resave_of_unchanged_career_refreshes_saved_at(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    stamps = iter(
+        [
+            datetime(2030, 1, 1, tzinfo=timezone.utc),
+            datetime(2030, 1, 2, tzinfo=timezone.utc),
+        ]
+    )
+
+    class _Clock:
+        @staticmethod
+        def now(tz: timezone | None = None) -> datetime:
+            return next(stamps)
+
+    monkeypatch.setattr(savegame, "datetime", _Clock)
+    boxer = create_boxer(
+        name="Repeat",
+        stance="orthodox",
+        height_ft=6,
+        height_in=0,
+        weight_lbs=160,
+    )
+    state = CareerState(boxer=boxer)
+
+    save_state(state, "repeat_slot", save_dir=tmp_path)
+    save_state(state, "repeat_slot", save_dir=tmp_path)
+
+    path = tmp_path / "repeat_slot.json.gz"
+    payload = json.loads(gzip.decompress(path.read_bytes()))
+    assert payload["saved_at"] == "2030-01-02T00:00:00+00:00"
+    assert load_state("repeat_slot", save_dir=tmp_path).to_dict() == state.to_dict()
+
+
+def test_legacy_json_slot_is_listed_renamed_and_replaced_on_save(tmp_path: Path) -> None:
+    boxer = create_boxer(
+        name="Legacy File",
+        stance="orthodox",
+        height_ft=5,
+        height_in=11,
+        weight_lbs=155,
+    )
+    state = CareerState(boxer=boxer)
+    packed = save_state(state, "old_format", save_dir=tmp_path)
+    legacy = tmp_path / "old_format.json"
+    legacy.write_bytes(gzip.decompress(packed.read_bytes()))
+    packed.unlink()
+
+    assert list_saves(save_dir=tmp_path) == ["old_format"]
+    renamed = rename_state("old_format", "kept_format", save_dir=tmp_path)
+    assert renamed.name == "kept_format.json"
+
+    path = save_state(state, "kept_format", save_dir=tmp_path)
+
+    assert path.name == "kept_format.json.gz"
+    assert sorted(item.name for item in tmp_path.iterdir()) == ["kept_format.json.gz"]
+    assert [item.slot for item in list_save_metadata(save_dir=tmp_path)] == ["kept_format"]